@@ -5,6 +5,7 @@ import time
 import hashlib
 from typing import List, Dict, Optional, Any, Tuple
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from config import (
     DEFAULT_API, 
     MEMPOOL_API_KEY,
@@ -368,8 +369,10 @@ class ElectrumXProvider(APIProvider):
         self.cert = cert if cert is not None else ELECTRUMX_CERT
         self.timeout = 30
         self.request_id = 0
-        self._persistent_sock = None  # Persistent connection for reuse
+        self._persistent_sock = None  # Persistent connection for reuse (only while a session() is open)
+        self._session_depth = 0  # Number of active session() blocks
         self._server_version = None  # Cached server version
+        self._ssl_context = None  # Built on first SSL connection and reused (loading CA certs is costly)
         self._last_logged_mb = 0  # For progress logging
     
     def _connect(self) -> bool:
@@ -379,44 +382,84 @@ class ElectrumXProvider(APIProvider):
         
         try:
             # Use same simple socket setup as test_connectivity.py (which works)
-            # Note: Don't use persistent connections with ElectrumX - create fresh for each request
-            if self.use_ssl and HAS_SSL:
-                print(f"[ELECTRUMX] Establishing connection to {self.host}:{self.port} (SSL)...")
-                context = ssl.create_default_context()
-                if self.cert:
-                    context.load_verify_locations(self.cert)
-                else:
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(self.timeout)
-                sock.connect((self.host, self.port))
-                self._persistent_sock = context.wrap_socket(sock, server_hostname=self.host)
-            else:
-                print(f"[ELECTRUMX] Establishing connection to {self.host}:{self.port} (TCP)...")
-                self._persistent_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self._persistent_sock.settimeout(self.timeout)
-                self._persistent_sock.connect((self.host, self.port))
-            
+            # Note: only used inside session(); ElectrumX closes idle connections, so requests
+            # outside a session create a fresh socket each time
+            mode = "SSL" if self.use_ssl and HAS_SSL else "TCP"
+            print(f"[ELECTRUMX] Establishing connection to {self.host}:{self.port} ({mode})...")
+            self._persistent_sock = self._open_socket()
             return True
         except Exception as e:
             print(f"[ELECTRUMX] Failed to establish persistent connection: {e}")
             self._persistent_sock = None
             return False
     
+    def _open_socket(self):
+        """Open a fresh connection to the server, SSL-wrapped if configured"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect((self.host, self.port))
+            # Requests are small request/response messages; don't let Nagle delay them
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.use_ssl and HAS_SSL:
+                sock = self._get_ssl_context().wrap_socket(sock, server_hostname=self.host)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def _get_ssl_context(self):
+        """Return the provider's SSL context, creating it on first use"""
+        if self._ssl_context is None:
+            context = ssl.create_default_context()
+            if self.cert:
+                context.load_verify_locations(self.cert)
+            else:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+    
     async def open(self):
         """Initialize provider (connections are created per-request for reliability)"""
         print(f"[ELECTRUMX] Provider ready for {self.host}:{self.port}")
         return True
     
     async def close(self):
-        """Cleanup provider (connections are closed per-request automatically)"""
+        """Cleanup provider (per-request connections are closed automatically)"""
+        self._disconnect()
         print(f"[ELECTRUMX] Provider closed")
     
+    @asynccontextmanager
+    async def session(self):
+        """
+        Reuse one connection for every request made inside the block
+        
+        Outside a session each request opens and closes its own socket. If the server
+        drops the session connection, the next request reconnects.
+        """
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if self._session_depth == 0:
+                self._disconnect()
+    
     def _disconnect(self):
-        """Close the persistent connection (legacy, kept for compatibility)"""
-        pass
+        """Close the persistent connection, if any"""
+        self._release_socket(self._persistent_sock)
+    
+    def _release_socket(self, sock):
+        """Close a request socket, forgetting it if it was the persistent connection"""
+        if sock is None:
+            return
+        if sock is self._persistent_sock:
+            self._persistent_sock = None
+        try:
+            sock.close()
+        except:
+            pass
     
     def _address_to_scripthash(self, address: str) -> Optional[str]:
         """
@@ -647,7 +690,7 @@ class ElectrumXProvider(APIProvider):
             return False
     
     async def _send_request(self, method: str, params: list, timeout: Optional[int] = None, max_retries: int = 3) -> Dict[str, Any]:
-        """Send a JSON-RPC request to ElectrumX over persistent connection"""
+        """Send a JSON-RPC request to ElectrumX (over the session connection when one is open)"""
         self.request_id += 1
         # Reset progress logging for this request
         self._last_logged_mb = 0
@@ -667,35 +710,22 @@ class ElectrumXProvider(APIProvider):
                 if attempt > 0:
                     print(f"[ELECTRUMX] Retry attempt {attempt + 1}/{max_retries}...")
                     await asyncio.sleep(retry_delay * attempt)  # Exponential backoff
-                # Create a fresh socket for each request (ElectrumX closes idle connections quickly)
-                # This matches how test_connectivity.py works - create socket, send, receive, close
+                # Inside a session(), reuse its persistent connection
                 sock = None
-                try:
-                    if self.use_ssl and HAS_SSL:
-                        context = ssl.create_default_context()
-                        if self.cert:
-                            context.load_verify_locations(self.cert)
-                        else:
-                            context.check_hostname = False
-                            context.verify_mode = ssl.CERT_NONE
-                        
-                        raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                        raw_sock.settimeout(self.timeout)
-                        raw_sock.connect((self.host, self.port))
-                        sock = context.wrap_socket(raw_sock, server_hostname=self.host)
-                    else:
-                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                        sock.settimeout(self.timeout)
-                        sock.connect((self.host, self.port))
-                except Exception as e:
-                    if attempt == 0:
-                        print(f"[ELECTRUMX] Connection failed: {e}")
-                    if sock:
-                        try:
-                            sock.close()
-                        except:
-                            pass
-                    continue  # Retry
+                if self._session_depth:
+                    if not self._connect():
+                        continue  # Retry
+                    sock = self._persistent_sock
+                    sock.settimeout(self.timeout)
+                else:
+                    # Otherwise create a fresh socket for each request (ElectrumX closes idle connections quickly)
+                    # This matches how test_connectivity.py works - create socket, send, receive, close
+                    try:
+                        sock = self._open_socket()
+                    except Exception as e:
+                        if attempt == 0:
+                            print(f"[ELECTRUMX] Connection failed: {e}")
+                        continue  # Retry
                 
                 # Send JSON-RPC request - use exact same format as working test_connectivity.py
                 message = json.dumps(request) + "\n"
@@ -710,25 +740,23 @@ class ElectrumXProvider(APIProvider):
                 except (BrokenPipeError, OSError) as e:
                     if attempt == 0:
                         print(f"[ELECTRUMX] Error sending request: {e}")
-                    try:
-                        sock.close()
-                    except:
-                        pass
+                    self._release_socket(sock)
                     continue  # Retry
                 
                 # Read response - Electrum protocol uses newline-delimited JSON
                 # Read until we get a complete line (JSON object ending with newline)
                 # Use EXACT same approach as test_connectivity.py which works
                 response_data = b""
-                buffer = b""
-                start_time = time.time()
+                complete = False  # Whether a full newline-terminated message was read
+                buffer = bytearray()  # Grows in place; bytes += bytes would copy the whole buffer per chunk
                 max_response_size = 50 * 1024 * 1024  # 50MB safety limit
                 chunk_size = 4096  # Same as test_connectivity.py
-                read_timeout = 10  # Same as test_connectivity.py
+                read_timeout = 10  # Total read budget
+                deadline = time.monotonic() + read_timeout
+                sock.settimeout(2)  # Per-recv timeout, set once; only shortened when the budget runs low
                 
-                while (time.time() - start_time) < read_timeout:
+                while time.monotonic() < deadline:
                     try:
-                        sock.settimeout(2)  # Same 2s timeout as test_connectivity.py
                         chunk = sock.recv(chunk_size)
                         if not chunk:
                             # Connection closed by server
@@ -736,53 +764,41 @@ class ElectrumXProvider(APIProvider):
                                 print(f"[ELECTRUMX] Server closed connection during read for {method}")
                             break
                         
-                        buffer += chunk
+                        buffer.extend(chunk)
                         
                         # Debug: Log first chunk received (only if ELECTRUMX_DEBUG is enabled)
                         if ELECTRUMX_DEBUG and attempt == 0 and len(buffer) == len(chunk):
                             print(f"[ELECTRUMX] Received first chunk: {len(chunk)} bytes for {method}")
                         
-                        # Check if we have a complete line (newline-delimited JSON)
-                        if b'\n' in buffer:
-                            # Split by newline and take the first complete message
-                            parts = buffer.split(b'\n', 1)
-                            response_data = parts[0]
-                            buffer = parts[1] if len(parts) > 1 else b""
+                        # Check if we have a complete line (newline-delimited JSON) and take the first message.
+                        # Earlier bytes were already scanned, so only search the new chunk.
+                        newline = buffer.find(b'\n', len(buffer) - len(chunk))
+                        if newline >= 0:
+                            response_data = bytes(buffer[:newline])
+                            complete = True
                             if ELECTRUMX_DEBUG and attempt == 0:
                                 print(f"[ELECTRUMX] Received complete response: {len(response_data)} bytes for {method}")
                             break
                         
-                        # Safety check: prevent excessive memory usage
+                        # Safety check: prevent excessive memory usage (no newline yet, checked above)
                         if len(buffer) > max_response_size:
                             print(f"[ELECTRUMX] Response exceeds maximum size ({max_response_size} bytes)")
-                            # Still try to find newline in what we have
-                            if b'\n' in buffer:
-                                parts = buffer.split(b'\n', 1)
-                                response_data = parts[0]
-                                buffer = parts[1] if len(parts) > 1 else b""
                             break
                             
                     except socket.timeout:
                         # If we have some data, try to use it (like test_connectivity.py)
                         if buffer:
-                            # Check if we have a newline now
-                            if b'\n' in buffer:
-                                parts = buffer.split(b'\n', 1)
-                                response_data = parts[0]
-                                buffer = parts[1] if len(parts) > 1 else b""
-                                if ELECTRUMX_DEBUG and attempt == 0:
-                                    print(f"[ELECTRUMX] Received response on timeout: {len(response_data)} bytes for {method}")
-                                break
-                            # If we have data but no newline, use it anyway (like test_connectivity.py)
-                            response_data = buffer
-                            buffer = b""
+                            # Every chunk was already checked for a newline, so this is an incomplete response
+                            response_data = bytes(buffer)
                             if ELECTRUMX_DEBUG and attempt == 0:
                                 print(f"[ELECTRUMX] Using incomplete response: {len(response_data)} bytes for {method}")
                             break
-                        # No data yet, continue waiting
-                        elapsed = time.time() - start_time
-                        if ELECTRUMX_DEBUG and attempt == 0 and elapsed > 2.0:
-                            print(f"[ELECTRUMX] Still waiting for response for {method} (elapsed: {elapsed:.1f}s)")
+                        # No data yet, continue waiting (without overrunning the total read budget)
+                        remaining = deadline - time.monotonic()
+                        if remaining < 2:
+                            sock.settimeout(max(0.01, remaining))
+                        if ELECTRUMX_DEBUG and attempt == 0:
+                            print(f"[ELECTRUMX] Still waiting for response for {method} (elapsed: {read_timeout - remaining:.1f}s)")
                         continue
                     except (BrokenPipeError, ConnectionResetError, OSError) as e:
                         if attempt == 0:
@@ -791,15 +807,14 @@ class ElectrumXProvider(APIProvider):
                 
                 # If we exited the loop without finding newline but have data, use it
                 if not response_data and buffer:
-                    response_data = buffer
+                    response_data = bytes(buffer)
                     if ELECTRUMX_DEBUG and attempt == 0:
                         print(f"[ELECTRUMX] Using buffer data after loop: {len(response_data)} bytes for {method}")
                 
-                # Close socket after request (like test_connectivity.py)
-                try:
-                    sock.close()
-                except:
-                    pass
+                # Close socket after request (like test_connectivity.py). A session connection stays
+                # open, unless the read was partial and left the stream out of step.
+                if sock is not self._persistent_sock or not complete:
+                    self._release_socket(sock)
                 
                 # Parse response
                 if not response_data:
@@ -825,6 +840,9 @@ class ElectrumXProvider(APIProvider):
                     # Validate JSON-RPC response structure
                     is_valid, validation_error = self._validate_jsonrpc_response(response, self.request_id)
                     if not is_valid:
+                        # A mismatched reply (e.g. a late answer to an earlier request) means a
+                        # session connection is out of step, so drop it before retrying
+                        self._release_socket(self._persistent_sock)
                         if attempt < max_retries - 1:
                             print(f"[ELECTRUMX] Invalid JSON-RPC response, will retry: {validation_error}")
                             continue
@@ -855,44 +873,28 @@ class ElectrumXProvider(APIProvider):
             
             except socket.timeout:
                 # Ensure socket is closed
-                if sock:
-                    try:
-                        sock.close()
-                    except:
-                        pass
+                self._release_socket(sock)
                 if attempt < max_retries - 1:
                     print(f"[ELECTRUMX] Socket timeout, will retry...")
                     continue
                 print(f"[ELECTRUMX] Socket timeout after {request_timeout}s (all retries exhausted)")
                 return {}
             except ConnectionRefusedError:
-                if sock:
-                    try:
-                        sock.close()
-                    except:
-                        pass
+                self._release_socket(sock)
                 if attempt < max_retries - 1:
                     print(f"[ELECTRUMX] Connection refused, will retry...")
                     continue
                 print(f"[ELECTRUMX] Connection refused to {self.host}:{self.port}")
                 return {}
             except (BrokenPipeError, ConnectionResetError, OSError) as e:
-                if sock:
-                    try:
-                        sock.close()
-                    except:
-                        pass
+                self._release_socket(sock)
                 if attempt < max_retries - 1:
                     print(f"[ELECTRUMX] Connection lost, will retry: {str(e)[:50]}")
                     continue
                 print(f"[ELECTRUMX] Connection error: {str(e)[:100]}")
                 return {}
             except Exception as e:
-                if sock:
-                    try:
-                        sock.close()
-                    except:
-                        pass
+                self._release_socket(sock)
                 if attempt < max_retries - 1:
                     print(f"[ELECTRUMX] Error (will retry): {str(e)[:100]}")
                     continue
@@ -902,6 +904,83 @@ class ElectrumXProvider(APIProvider):
         # All retries exhausted
         return {}
     
+    async def _send_batch(self, method: str, params_list: List[list], max_retries: int = 3) -> List[Any]:
+        """
+        Pipeline several JSON-RPC requests for one method over a single connection
+        
+        All requests are written with one sendall and the newline-delimited replies
+        are matched back by id, so N requests cost about one round-trip. If the
+        connection drops (e.g. a stale session socket), the requests still unanswered
+        are resent on a fresh connection, with the same backoff as _send_request.
+        Every entry in params_list is sent as its own request, duplicates included.
+        
+        Returns:
+            Results in request order (None for requests that got no reply or an RPC error)
+        """
+        if not params_list:
+            return []
+        
+        lines = {}  # request id -> encoded request line
+        for params in params_list:
+            self.request_id += 1
+            lines[self.request_id] = json.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": self.request_id})
+        
+        replies = {}
+        retry_delay = 2  # Start with 2 seconds
+        for attempt in range(max_retries):
+            pending = [request_id for request_id in lines if request_id not in replies]
+            if not pending:
+                break
+            if attempt > 0:
+                print(f"[ELECTRUMX] Resending {len(pending)} unanswered batch {method} request(s), attempt {attempt + 1}/{max_retries}...")
+                await asyncio.sleep(retry_delay * attempt)  # Exponential backoff
+            
+            sock = None
+            received = 0
+            try:
+                # Inside a session(), reuse its persistent connection
+                if self._session_depth:
+                    if not self._connect():
+                        continue  # Retry
+                    sock = self._persistent_sock
+                else:
+                    sock = self._open_socket()
+                sock.settimeout(self.timeout)
+                sock.sendall(("\n".join(lines[request_id] for request_id in pending) + "\n").encode('utf-8'))
+                
+                with sock.makefile('rb') as reader:
+                    while received < len(pending):
+                        line = reader.readline()
+                        if not line:
+                            print(f"[ELECTRUMX] Server closed connection during batch {method}")
+                            break
+                        response = json.loads(line)
+                        response_id = response.get("id") if isinstance(response, dict) else None
+                        if response_id not in lines or response_id in replies:
+                            continue  # Server notification or stray reply, not one of ours
+                        replies[response_id] = response
+                        received += 1
+            except (OSError, ValueError) as e:
+                print(f"[ELECTRUMX] Batch {method} failed after {len(replies)}/{len(lines)} replies: {str(e)[:100]}")
+            finally:
+                # A session connection stays open only if every reply was read
+                if sock is not self._persistent_sock or received < len(pending):
+                    self._release_socket(sock)
+        
+        results = []
+        for request_id in lines:
+            response = replies.get(request_id)
+            if response is None:
+                print(f"[ELECTRUMX] No reply to batch {method} request id {request_id}")
+                results.append(None)
+            elif response.get("error"):
+                error_data = response["error"]
+                print(f"[ELECTRUMX] RPC error [{error_data.get('code', 'unknown')}]: {error_data.get('message', str(error_data))}")
+                results.append(None)
+            else:
+                results.append(response.get("result", {}))
+        return results
+    
     def _should_skip_large_transaction(self, tx_data: Any, response_size_bytes: int = 0) -> bool:
         """
         Check if a transaction should be skipped based on size or input/output counts.
@@ -1162,111 +1241,138 @@ class ElectrumXProvider(APIProvider):
             
             # Step 1: Get transaction history (list of tx hashes)
             history = await self._send_request("blockchain.scripthash.get_history", [scripthash])
+            return await self._fetch_history_transactions(address, history, start_block, end_block)
+        
+        except Exception as e:
+            print(f"[ELECTRUMX] Error fetching transactions: {str(e)[:100]}")
+            return []
+    
+    async def get_addresses_transactions_batch(self, addresses: List[str],
+                                               start_block: Optional[int] = None,
+                                               end_block: Optional[int] = None) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Fetch transactions for several addresses, pipelining the history lookups
+        
+        The blockchain.scripthash.get_history requests for all addresses go out in one
+        batch; full transaction details are then fetched per address exactly as in
+        get_address_transactions(). Addresses are not deduplicated: a repeated address
+        is queried again.
+        
+        Returns:
+            One entry per input address, in order: its transactions, or None if the
+            history lookup got no reply or an error
+        """
+        results = [None] * len(addresses)
+        pending = []  # (index, scripthash) for addresses that converted
+        for index, address in enumerate(addresses):
+            scripthash = self._address_to_scripthash(address)
+            if scripthash:
+                pending.append((index, scripthash))
+            else:
+                print(f"[ELECTRUMX] Could not convert address {address} to scripthash")
+        
+        histories = await self._send_batch("blockchain.scripthash.get_history", [[sh] for _, sh in pending])
+        for (index, _), history in zip(pending, histories):
+            if history is None:
+                continue  # Already reported by _send_batch
+            address = addresses[index]
+            try:
+                results[index] = await self._fetch_history_transactions(address, history, start_block, end_block)
+            except Exception as e:
+                print(f"[ELECTRUMX] Error fetching transactions for {address}: {str(e)[:100]}")
+        return results
+    
+    async def _fetch_history_transactions(self, address: str, history: Any,
+                                          start_block: Optional[int] = None,
+                                          end_block: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Filter an address's get_history result and fetch full details for its transactions"""
+        if not history or not isinstance(history, list):
+            print(f"[ELECTRUMX] No transactions found for {address}")
+            return []
+        
+        total_tx_count = len(history)
+        print(f"[ELECTRUMX] Found {total_tx_count} transaction entries")
+        
+        # EARLY FILTERING: Skip addresses with too many transactions (likely exchanges)
+        if total_tx_count > EXCHANGE_WALLET_THRESHOLD:
+            print(f"[ELECTRUMX] SKIPPING address {address}: {total_tx_count} txs exceeds exchange threshold ({EXCHANGE_WALLET_THRESHOLD})")
+            return []
+        
+        # Step 2: Filter by block range and collect tx hashes
+        tx_hashes_to_fetch = []
+        for entry in history:
+            tx_hash = entry.get("tx_hash")
+            height = entry.get("height", 0)
+            
+            # Filter by block range if specified
+            if start_block and height > 0 and height < start_block:
+                continue
+            if end_block and height > 0 and height > end_block:
+                continue
             
-            if not history or not isinstance(history, list):
-                print(f"[ELECTRUMX] No transactions found for {address}")
-                return []
-            
-            total_tx_count = len(history)
-            print(f"[ELECTRUMX] Found {total_tx_count} transaction entries")
-            
-            # EARLY FILTERING: Skip addresses with too many transactions (likely exchanges)
-            if total_tx_count > EXCHANGE_WALLET_THRESHOLD:
-                print(f"[ELECTRUMX] SKIPPING address {address}: {total_tx_count} txs exceeds exchange threshold ({EXCHANGE_WALLET_THRESHOLD})")
-                return []
-            
-            # Step 2: Filter by block range and collect tx hashes
-            tx_hashes_to_fetch = []
-            for entry in history:
-                tx_hash = entry.get("tx_hash")
-                height = entry.get("height", 0)
+            tx_hashes_to_fetch.append((tx_hash, height))
+        
+        # LIMIT transactions to fetch (avoid wasting resources on high-activity addresses)
+        if len(tx_hashes_to_fetch) > MAX_TRANSACTIONS_PER_ADDRESS:
+            print(f"[ELECTRUMX] Limiting fetch to {MAX_TRANSACTIONS_PER_ADDRESS} of {len(tx_hashes_to_fetch)} transactions (MAX_TRANSACTIONS_PER_ADDRESS)")
+            # Take most recent transactions (usually at end of history, but sort by height to be safe)
+            tx_hashes_to_fetch = sorted(tx_hashes_to_fetch, key=lambda x: x[1] if x[1] > 0 else float('inf'), reverse=True)[:MAX_TRANSACTIONS_PER_ADDRESS]
+        
+        print(f"[ELECTRUMX] Fetching full details for {len(tx_hashes_to_fetch)} transactions")
+        
+        # Step 3: Fetch full transaction details for each
+        transactions = []
+        debug_logged = False  # Log first transaction for debugging
+        for idx, (tx_hash, height) in enumerate(tx_hashes_to_fetch):
+            try:
+                # Fetch full transaction using blockchain.transaction.get
+                # verbose=True returns parsed JSON, verbose=False returns raw hex
+                tx_data = await self._send_request("blockchain.transaction.get", [tx_hash, True])
                 
-                # Filter by block range if specified
-                if start_block and height > 0 and height < start_block:
-                    continue
-                if end_block and height > 0 and height > end_block:
-                    continue
+                # Debug: Log first transaction response to verify format
+                if not debug_logged and tx_data:
+                    print(f"[ELECTRUMX] DEBUG: First tx response type: {type(tx_data).__name__}")
+                    if isinstance(tx_data, dict):
+                        print(f"[ELECTRUMX] DEBUG: First tx keys: {list(tx_data.keys())[:10]}")
+                    elif isinstance(tx_data, str):
+                        print(f"[ELECTRUMX] DEBUG: First tx (hex): {tx_data[:100]}...")
+                    debug_logged = True
                 
-                tx_hashes_to_fetch.append((tx_hash, height))
-            
-            # LIMIT transactions to fetch (avoid wasting resources on high-activity addresses)
-            if len(tx_hashes_to_fetch) > MAX_TRANSACTIONS_PER_ADDRESS:
-                print(f"[ELECTRUMX] Limiting fetch to {MAX_TRANSACTIONS_PER_ADDRESS} of {len(tx_hashes_to_fetch)} transactions (MAX_TRANSACTIONS_PER_ADDRESS)")
-                # Take most recent transactions (usually at end of history, but sort by height to be safe)
-                tx_hashes_to_fetch = sorted(tx_hashes_to_fetch, key=lambda x: x[1] if x[1] > 0 else float('inf'), reverse=True)[:MAX_TRANSACTIONS_PER_ADDRESS]
-            
-            print(f"[ELECTRUMX] Fetching full details for {len(tx_hashes_to_fetch)} transactions")
-            
-            # Step 3: Fetch full transaction details for each
-            transactions = []
-            debug_logged = False  # Log first transaction for debugging
-            for idx, (tx_hash, height) in enumerate(tx_hashes_to_fetch):
-                try:
-                    # Fetch full transaction using blockchain.transaction.get
-                    # verbose=True returns parsed JSON, verbose=False returns raw hex
-                    tx_data = await self._send_request("blockchain.transaction.get", [tx_hash, True])
-                    
-                    # Debug: Log first transaction response to verify format
-                    if not debug_logged and tx_data:
-                        print(f"[ELECTRUMX] DEBUG: First tx response type: {type(tx_data).__name__}")
-                        if isinstance(tx_data, dict):
-                            print(f"[ELECTRUMX] DEBUG: First tx keys: {list(tx_data.keys())[:10]}")
-                        elif isinstance(tx_data, str):
-                            print(f"[ELECTRUMX] DEBUG: First tx (hex): {tx_data[:100]}...")
-                        debug_logged = True
+                # If verbose mode returned hex string or empty, we can't parse addresses
+                # ElectrumX with verbose=True should return a dict with transaction details
+                if not tx_data:
+                    # Try without verbose flag (returns hex)
+                    tx_data = await self._send_request("blockchain.transaction.get", [tx_hash])
+                    if tx_data and isinstance(tx_data, str):
+                        # Got hex string - check size before processing
+                        hex_size = len(tx_data.encode('utf-8')) if isinstance(tx_data, str) else 0
+                        if self._should_skip_large_transaction(tx_data, hex_size):
+                            continue  # Skip this transaction
+                        # Got hex string - we can't extract addresses from this
+                        tx_data = None  # Will use fallback
+                
+                if tx_data:
+                    # Check if transaction should be skipped before converting (saves resources)
+                    if self._should_skip_large_transaction(tx_data):
+                        continue  # Skip this transaction
                     
-                    # If verbose mode returned hex string or empty, we can't parse addresses
-                    # ElectrumX with verbose=True should return a dict with transaction details
-                    if not tx_data:
-                        # Try without verbose flag (returns hex)
-                        tx_data = await self._send_request("blockchain.transaction.get", [tx_hash])
-                        if tx_data and isinstance(tx_data, str):
-                            # Got hex string - check size before processing
-                            hex_size = len(tx_data.encode('utf-8')) if isinstance(tx_data, str) else 0
-                            if self._should_skip_large_transaction(tx_data, hex_size):
-                                continue  # Skip this transaction
-                            # Got hex string - we can't extract addresses from this
-                            tx_data = None  # Will use fallback
+                    # Convert to Mempool format
+                    tx_obj = self._convert_electrum_tx_to_mempool_format(tx_data, tx_hash, height)
                     
-                    if tx_data:
-                        # Check if transaction should be skipped before converting (saves resources)
-                        if self._should_skip_large_transaction(tx_data):
-                            continue  # Skip this transaction
-                        
-                        # Convert to Mempool format
-                        tx_obj = self._convert_electrum_tx_to_mempool_format(tx_data, tx_hash, height)
-                        
-                        # CRITICAL: Resolve input addresses by fetching previous transactions
-                        # This is required for backward tracing to work properly
-                        tx_obj = await self._resolve_input_addresses(tx_obj)
-                        
-                        # Validate transaction format
-                        is_valid, validation_error = self._validate_transaction_format(tx_obj)
-                        if not is_valid:
-                            print(f"[ELECTRUMX] Warning: Transaction format validation failed for {tx_hash[:16]}...: {validation_error}")
-                            # Still add it, but log the warning
-                        
-                        transactions.append(tx_obj)
-                    else:
-                        # Fallback: create minimal transaction object
-                        print(f"[ELECTRUMX] Warning: Could not fetch full details for {tx_hash[:16]}...")
-                        transactions.append({
-                            "txid": tx_hash,
-                            "hash": tx_hash,
-                            "status": {"block_height": height if height > 0 else None},
-                            "vin": [],
-                            "vout": []
-                        })
+                    # CRITICAL: Resolve input addresses by fetching previous transactions
+                    # This is required for backward tracing to work properly
+                    tx_obj = await self._resolve_input_addresses(tx_obj)
                     
-                    # Progress logging and small delay to avoid overwhelming ElectrumX
-                    if (idx + 1) % 100 == 0:
-                        print(f"[ELECTRUMX] Progress: {idx + 1}/{len(tx_hashes_to_fetch)} transactions fetched")
-                    if (idx + 1) % 10 == 0:
-                        await asyncio.sleep(0.05)  # Small delay every 10 transactions
+                    # Validate transaction format
+                    is_valid, validation_error = self._validate_transaction_format(tx_obj)
+                    if not is_valid:
+                        print(f"[ELECTRUMX] Warning: Transaction format validation failed for {tx_hash[:16]}...: {validation_error}")
+                        # Still add it, but log the warning
                     
-                except Exception as e:
-                    print(f"[ELECTRUMX] Error fetching transaction {tx_hash[:16]}...: {str(e)[:50]}")
-                    # Add minimal transaction object as fallback
+                    transactions.append(tx_obj)
+                else:
+                    # Fallback: create minimal transaction object
+                    print(f"[ELECTRUMX] Warning: Could not fetch full details for {tx_hash[:16]}...")
                     transactions.append({
                         "txid": tx_hash,
                         "hash": tx_hash,
@@ -1274,13 +1380,26 @@ class ElectrumXProvider(APIProvider):
                         "vin": [],
                         "vout": []
                     })
-            
-            print(f"[ELECTRUMX] Retrieved {len(transactions)} full transaction details")
-            return transactions
+                
+                # Progress logging and small delay to avoid overwhelming ElectrumX
+                if (idx + 1) % 100 == 0:
+                    print(f"[ELECTRUMX] Progress: {idx + 1}/{len(tx_hashes_to_fetch)} transactions fetched")
+                if (idx + 1) % 10 == 0:
+                    await asyncio.sleep(0.05)  # Small delay every 10 transactions
+                
+            except Exception as e:
+                print(f"[ELECTRUMX] Error fetching transaction {tx_hash[:16]}...: {str(e)[:50]}")
+                # Add minimal transaction object as fallback
+                transactions.append({
+                    "txid": tx_hash,
+                    "hash": tx_hash,
+                    "status": {"block_height": height if height > 0 else None},
+                    "vin": [],
+                    "vout": []
+                })
         
-        except Exception as e:
-            print(f"[ELECTRUMX] Error fetching transactions: {str(e)[:100]}")
-            return []
+        print(f"[ELECTRUMX] Retrieved {len(transactions)} full transaction details")
+        return transactions
     
     async def get_balance(self, address: str) -> Dict[str, Any]:
         """Get balance for an address"""
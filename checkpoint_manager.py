@@ -4,11 +4,13 @@ Checkpoint Manager - Handles resumable session state
 """
 
 import json
+import os
 import pickle
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple, Set
 import uuid
+from collections import defaultdict
 from config import CHECKPOINT_DIR
 
 
@@ -87,6 +89,28 @@ class CheckpointManager:
         with open(checkpoint_file, 'wb') as f:
             pickle.dump(checkpoint_data, f)
 
+        # Sidecar with just the counts, so tools can summarize without unpickling
+        trace_state = state.get('trace_state', {})
+        meta = {
+            'timestamp': checkpoint_data['timestamp'],
+            'visited': len(trace_state.get('visited', [])),
+            'queued_forward': len(trace_state.get('queued_forward', [])),
+            'queued_backward': len(trace_state.get('queued_backward', [])),
+        }
+        # The sidecar is only an optimization: write it atomically (temp file + rename) so a
+        # partial file is never read as counts, and never fail a checkpoint that is saved
+        meta_file = checkpoint_file.with_suffix('.meta.json')
+        tmp_file = meta_file.with_name(meta_file.name + '.tmp')
+        try:
+            tmp_file.write_text(json.dumps(meta))
+            os.replace(tmp_file, meta_file)
+        except OSError as e:
+            print(f"[WARN] Failed to write checkpoint metadata {meta_file}: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
         print(f"[SAVE] Checkpoint saved: {checkpoint_id}")
         return checkpoint_id
 
@@ -110,11 +134,8 @@ class CheckpointManager:
             print(f"[ERR] Failed to load checkpoint: {e}")
             return None
 
-    def list_checkpoints(self, session_id: str) -> List[Dict[str, Any]]:
-        """List all checkpoints for a session"""
-        checkpoints = []
-        pattern = f"{session_id}_*.pkl"
-
+    def _iter_checkpoint_info(self, pattern: str):
+        """Yield checkpoint info dicts (checkpoint_id, timestamp, session_id) for files matching pattern"""
         for checkpoint_file in self.checkpoint_dir.glob(pattern):
             try:
                 with open(checkpoint_file, 'rb') as f:
@@ -128,15 +149,19 @@ class CheckpointManager:
                     print(f"[WARN] Could not extract checkpoint_id from filename: {checkpoint_file.name}")
                     continue
 
-                checkpoints.append({
+                yield {
                     'checkpoint_id': checkpoint_id,
                     'timestamp': data['timestamp'],
                     'session_id': data['session_id']
-                })
+                }
             except Exception as e:
                 print(f"[WARN] Failed to load checkpoint {checkpoint_file}: {e}")
                 continue
 
+    def list_checkpoints(self, session_id: str) -> List[Dict[str, Any]]:
+        """List all checkpoints for a session"""
+        checkpoints = list(self._iter_checkpoint_info(f"{session_id}_*.pkl"))
+
         # Sort by timestamp, most recent first
         checkpoints.sort(key=lambda x: x['timestamp'], reverse=True)
         return checkpoints
@@ -213,6 +238,7 @@ class CheckpointManager:
         if checkpoint_file.exists():
             try:
                 checkpoint_file.unlink()
+                checkpoint_file.with_suffix('.meta.json').unlink(missing_ok=True)
                 print(f"[DEL] Checkpoint deleted: {checkpoint_id}")
                 return True
             except Exception as e:
@@ -238,6 +264,7 @@ class CheckpointManager:
         for checkpoint_file in self.checkpoint_dir.glob(pattern):
             try:
                 checkpoint_file.unlink()
+                checkpoint_file.with_suffix('.meta.json').unlink(missing_ok=True)
                 deleted_count += 1
             except Exception as e:
                 print(f"[ERR] Failed to delete {checkpoint_file}: {e}")
@@ -252,29 +279,16 @@ class CheckpointManager:
         Get list of checkpoints that can be deleted (all but the most recent for each session).
         Returns list of checkpoint info dicts with session_id, checkpoint_id, and timestamp.
         """
-        old_checkpoints = []
+        # Group every checkpoint by session in a single pass over the directory
+        checkpoints_by_session = defaultdict(list)
+        for checkpoint in self._iter_checkpoint_info("*.pkl"):
+            checkpoints_by_session[checkpoint['session_id']].append(checkpoint)
         
-        # Get all unique session IDs from checkpoint files
-        checkpoint_files = list(self.checkpoint_dir.glob("*.pkl"))
-        session_ids = set()
-        
-        for f in checkpoint_files:
-            session_id = f.stem.split('_')[0]
-            session_ids.add(session_id)
-        
-        # For each session, get all checkpoints and keep only the most recent
-        for session_id in session_ids:
-            checkpoints = self.list_checkpoints(session_id)
-            
-            # list_checkpoints returns checkpoints sorted by timestamp, most recent first
-            # Keep the first one (most recent), mark the rest for deletion
-            if len(checkpoints) > 1:
-                for checkpoint in checkpoints[1:]:  # Skip the first (most recent)
-                    old_checkpoints.append({
-                        'session_id': checkpoint['session_id'],
-                        'checkpoint_id': checkpoint['checkpoint_id'],
-                        'timestamp': checkpoint['timestamp']
-                    })
+        # Keep the most recent checkpoint per session, mark the rest for deletion
+        old_checkpoints = []
+        for session_checkpoints in checkpoints_by_session.values():
+            latest = max(session_checkpoints, key=lambda x: x['timestamp'])
+            old_checkpoints.extend(cp for cp in session_checkpoints if cp is not latest)
         
         return old_checkpoints
 
@@ -5,10 +5,19 @@ Fetches ElectrumX Docker logs via SSH for monitoring and debugging
 """
 import sys
 import os
+import re
 import subprocess
 from typing import Optional, Tuple, List
 from config import SSH_HOST, SSH_USER, SSH_KEY_PATH, SSH_PORT, ELECTRUMX_DOCKER_CONTAINER
 
+# Log patterns, compiled once. Each scans the whole log text in one pass and
+# returns matching lines, instead of lowercasing and substring-testing every line.
+ERROR_LINE_RE = re.compile(r'^.*error.*$', re.IGNORECASE | re.MULTILINE)
+WARNING_LINE_RE = re.compile(r'^.*warn.*$', re.IGNORECASE | re.MULTILINE)
+INDEXING_LINE_RE = re.compile(r'^.*index(?:ing|ed).*$', re.IGNORECASE | re.MULTILINE)
+SYNC_LINE_RE = re.compile(r'^.*sync.*$', re.IGNORECASE | re.MULTILINE)
+CONNECTION_ISSUE_RE = re.compile(r'connection refused|timeout|connection error|network error', re.IGNORECASE)
+
 
 def fetch_electrumx_logs(host: str, user: str, container: str, key_path: Optional[str] = None, 
                          port: int = 22, lines: int = 50) -> Tuple[bool, Optional[str]]:
@@ -165,32 +174,18 @@ def analyze_logs(logs: str) -> dict:
         "sync_status": None
     }
     
-    log_lines = logs.split('\n')
+    # Truncate long lines to 200 characters
+    analysis["errors"] = [line[:200] for line in ERROR_LINE_RE.findall(logs)]
+    analysis["warnings"] = [line[:200] for line in WARNING_LINE_RE.findall(logs)]
+    analysis["connection_issues"] = CONNECTION_ISSUE_RE.search(logs) is not None
     
-    for line in log_lines:
-        line_lower = line.lower()
-        
-        # Check for errors
-        if 'error' in line_lower or 'exception' in line_lower or 'failed' in line_lower:
-            if 'error' in line_lower:
-                analysis["errors"].append(line[:200])  # Truncate long lines
-        
-        # Check for warnings
-        if 'warning' in line_lower or 'warn' in line_lower:
-            analysis["warnings"].append(line[:200])
-        
-        # Check for connection issues
-        if any(term in line_lower for term in ['connection refused', 'timeout', 'connection error', 'network error']):
-            analysis["connection_issues"] = True
-        
-        # Check for indexing status
-        if 'index' in line_lower:
-            if 'indexing' in line_lower or 'indexed' in line_lower:
-                analysis["indexing_status"] = line[:200]
-        
-        # Check for sync status
-        if 'sync' in line_lower or 'syncing' in line_lower or 'synced' in line_lower:
-            analysis["sync_status"] = line[:200]
+    # Status fields report the most recent matching line
+    indexing_lines = INDEXING_LINE_RE.findall(logs)
+    if indexing_lines:
+        analysis["indexing_status"] = indexing_lines[-1][:200]
+    sync_lines = SYNC_LINE_RE.findall(logs)
+    if sync_lines:
+        analysis["sync_status"] = sync_lines[-1][:200]
     
     return analysis
 
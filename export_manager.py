@@ -138,6 +138,33 @@ class ExportManager:
 
         print(f"  ✓ Updated exports: {len(export_info['json_data']['connections_found'])} connection(s)")
 
+    def delete_exports(self, paths: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Delete export files (JSON/CSV) from the export directory.
+        Paths outside the export directory or not named connections_* are refused.
+        Returns:
+            Tuple of (deleted, errors) where deleted lists the removed paths
+        """
+        export_dir = self.export_dir.resolve()
+        deleted = []
+        errors = []
+
+        for path_str in paths:
+            path = Path(path_str).resolve()
+            if path.parent != export_dir or not path.name.startswith('connections_'):
+                errors.append(f"Refusing to delete {path.name}: not an export file")
+                continue
+            try:
+                # Single unlink; a file that's already gone just isn't counted
+                path.unlink()
+                deleted.append(path_str)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                errors.append(f"Error deleting {path.name}: {e}")
+
+        return deleted, errors
+
     def finalize_incremental_export(self, session_id: str, results: Dict[str, Any]):
         """Finalize the incremental export with complete results"""
         if session_id not in self._active_exports:
@@ -1141,6 +1141,20 @@ async def get_checkpoint_details(session_id: str, checkpoint_id: str):
     }
 
 
+# Declared before /checkpoints/{session_id} so the static path is matched first
+@app.get("/checkpoints/cleanup/preview")
+async def preview_checkpoint_cleanup():
+    """Report which checkpoints cleanup would delete (read-only, never deletes)"""
+    try:
+        old_checkpoints = checkpoint_manager.get_old_checkpoints()
+        return {
+            'count': len(old_checkpoints),
+            'checkpoints': old_checkpoints
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error listing checkpoints: {str(e)}")
+
+
 @app.get("/checkpoints/{session_id}")
 async def list_checkpoints(session_id: str):
     """List all checkpoints for a session"""
@@ -1176,7 +1190,10 @@ async def delete_checkpoint(session_id: str, checkpoint_id: str):
 
 @app.post("/checkpoints/cleanup")
 async def cleanup_old_checkpoints():
-    """Delete all but the most recent checkpoint for each session"""
+    """
+    Delete all but the most recent checkpoint for each session.
+    Use GET /checkpoints/cleanup/preview to see what would be deleted.
+    """
     try:
         deleted_count, errors = checkpoint_manager.cleanup_old_checkpoints()
         
@@ -1189,6 +1206,21 @@ async def cleanup_old_checkpoints():
         raise HTTPException(status_code=500, detail=f"Error cleaning up checkpoints: {str(e)}")
 
 
+class ExportCleanupRequest(BaseModel):
+    paths: List[str]
+
+
+@app.post("/exports/cleanup")
+async def cleanup_exports(request: ExportCleanupRequest):
+    """Delete a batch of export files (JSON/CSV) in a single request"""
+    deleted, errors = export_manager.delete_exports(request.paths)
+    return {
+        'deleted': deleted,
+        'errors': errors,
+        'message': f'Deleted {len(deleted)} export file(s)'
+    }
+
+
 @app.post("/cleanup/{session_id}")
 async def cleanup_session(session_id: str):
     """Cleanup a completed or cancelled session"""
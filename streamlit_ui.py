@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import pickle
 from pathlib import Path
@@ -8,7 +9,23 @@ from datetime import datetime
 import time
 import socket
 import json
-from config import EXPORT_DIR, MAX_DEPTH
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Optional: incremental JSON parsing for large export files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: client-side auto-refresh timer (pip install streamlit-autorefresh)
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
+from config import CHECKPOINT_DIR, EXPORT_DIR, MAX_DEPTH
 
 # Check for dialog support (Streamlit 1.34+)
 if hasattr(st, "dialog"):
@@ -31,9 +48,71 @@ if dialog_decorator:
             help="Select all (Ctrl+A / Cmd+A) and copy (Ctrl+C / Cmd+C) to copy all addresses"
         )
 
+# Check for fragment support (Streamlit 1.37+); without it, fragments render as plain functions
+if hasattr(st, "fragment"):
+    fragment_decorator = st.fragment
+else:
+    fragment_decorator = None
+
+def rerun_fragment():
+    """Rerun only the enclosing fragment when supported, otherwise the whole app"""
+    if fragment_decorator:
+        st.rerun(scope="fragment")
+    else:
+        st.rerun()
+
 # Configuration
 API_URL = "http://localhost:8000"
 API_TIMEOUT = 600
+PROBE_CACHE_TTL = 30  # Seconds to reuse a failed ElectrumX connectivity probe result
+PROBE_SUCCESS_TTL = 300  # Seconds to reuse a successful probe (saving unrelated settings skips the re-probe)
+CLEANUP_SCAN_TTL = 30  # Seconds to reuse export/checkpoint cleanup scans across reruns
+EXPORT_NAME_RE = re.compile(r'^connections_([^_]+)_')  # Captures the session id from an export filename
+SMALL_EXPORT_BYTES = 4096  # Export JSONs up to this size are parsed whole instead of streamed
+
+# Suggested/default tracing thresholds used by "Reset to Suggested Values"
+SUGGESTED_THRESHOLDS = {
+    'mixer_input_threshold': 30,
+    'mixer_output_threshold': 30,
+    'suspicious_ratio_threshold': 10,
+    'skip_mixer_input_threshold': 50,
+    'skip_mixer_output_threshold': 50,
+    'skip_distribution_max_inputs': 2,
+    'skip_distribution_min_outputs': 100,
+    'max_transactions_per_address': 50,
+    'max_depth': 10,
+    'exchange_wallet_threshold': 1000,
+    'max_input_addresses_per_tx': 50,
+    'max_output_addresses_per_tx': 50
+}
+
+FOOTER_HTML = """
+<div style='text-align: center; color: gray; font-size: 12px;'>
+    <p>Bitcoin Address Linker | Streamlit UI</p>
+    {updated}
+</div>
+"""
+
+# Settings tab help text and suggested-value notes
+HELP_USE_CACHE = "When enabled, transactions are cached to speed up subsequent searches. Disable to bypass cache for troubleshooting (e.g., if connections are not being found). Note: Server restart may be required for this setting to take effect."
+HELP_MIXER_INPUT = "Minimum number of inputs to be considered 'mixer-like'. Transactions with this many or more inputs are flagged as potential mixers. Suggested: 30 (typical CoinJoin size)."
+HELP_MIXER_OUTPUT = "Minimum number of outputs to be considered 'mixer-like'. Transactions with this many or more outputs are flagged as potential mixers. Suggested: 30 (typical CoinJoin size)."
+HELP_SUSPICIOUS_RATIO = "Input:output or output:input ratio to flag as suspicious. Transactions with extreme ratios (e.g., 1 input to 100 outputs) are flagged. Suggested: 10 (catches 10:1 or 1:10 imbalances)."
+HELP_SKIP_MIXER_INPUT = "Minimum inputs for extreme mixer. Transactions with this many or more inputs are completely skipped (prevents queue flooding). Suggested: 50 (filters extreme mixers while allowing smaller ones)."
+HELP_SKIP_MIXER_OUTPUT = "Minimum outputs for extreme mixer. Transactions with this many or more outputs are completely skipped (prevents queue flooding). Suggested: 50 (filters extreme mixers while allowing smaller ones)."
+HELP_SKIP_DIST_MAX_INPUTS = "Maximum number of inputs to trigger distribution filter. Transactions with this many or fewer inputs AND the minimum outputs are considered distributions. Suggested: 2 (most airdrops have 1-2 inputs)."
+HELP_SKIP_DIST_MIN_OUTPUTS = "Minimum number of outputs to trigger distribution filter. Transactions with max inputs AND this many or more outputs are skipped. Suggested: 100 (catches airdrops while allowing normal transactions)."
+HELP_MAX_TX_PER_ADDR = "Maximum number of transactions to process per address. Addresses with more transactions are limited to this number. Suggested: 50 (balances thoroughness with performance)."
+HELP_MAX_DEPTH = "Maximum depth for tracing connections. Stops tracing after this many hops from the starting addresses. Suggested: 10 (allows multi-hop tracing while preventing infinite loops)."
+HELP_EXCHANGE_THRESHOLD = "Addresses with more than this many transactions are considered exchange wallets and are skipped entirely. Exchange wallets have too many transactions to be useful for tracing. Suggested: 1000 (identifies high-volume addresses like exchanges)."
+HELP_MAX_INPUT_ADDRS = "Maximum input addresses to process per transaction. If a transaction has more inputs, only the first N are processed (prevents queue flooding). Suggested: 50 (matches skip mixer threshold, prevents queue flooding)."
+HELP_MAX_OUTPUT_ADDRS = "Maximum output addresses to process per transaction. If a transaction has more outputs, only the first N are processed (prevents queue flooding). Suggested: 50 (matches skip mixer threshold, prevents queue flooding)."
+
+TIP_MIXER_DETECTION = "💡 **Suggested Values:** Input: 30, Output: 30, Ratio: 10 | These values are based on typical CoinJoin/mixer patterns where transactions have 30+ inputs/outputs. The ratio of 10 catches extreme imbalances (e.g., 1:10 or 10:1) that indicate suspicious patterns."
+TIP_TX_FILTERING = "💡 **Suggested Values:** Input: 50, Output: 50 | These values filter out extreme mixers (50+ inputs/outputs) that would create thousands of queue entries. This threshold is higher than the detection threshold (30) to allow some mixer analysis while preventing queue flooding from massive CoinJoin transactions."
+TIP_DISTRIBUTION = "💡 **Suggested Values:** Max Inputs: 2, Min Outputs: 100 | Most airdrops have 1-2 inputs (single funding source) and 100+ outputs (many recipients). This pattern (few inputs, many outputs) is the signature of distribution transactions. Setting max inputs to 2 catches 99% of airdrops while allowing legitimate multi-input transactions. The 100 output threshold ensures we only filter true distributions, not normal transactions with many outputs."
+TIP_PROCESSING_LIMITS = "💡 **Suggested Values:** Max TX/Address: 50, Max Depth: 10, Exchange Threshold: 1000 | Limiting to 50 transactions per address balances thoroughness with performance. Depth of 10 allows tracing through multiple hops while preventing infinite loops. Exchange threshold of 1000 identifies high-volume addresses (exchanges, services) that aren't useful for tracing individual connections."
+TIP_ADDRESS_LIMITS = "💡 **Suggested Values:** Max Input: 50, Max Output: 50 | These limits prevent queue flooding from large transactions while still processing a reasonable number of addresses. Transactions with 50+ inputs/outputs are already filtered by the skip mixer thresholds, so this acts as a safety net for edge cases. The value of 50 matches the skip mixer threshold to maintain consistency."
 
 # Page config
 st.set_page_config(
@@ -44,20 +123,16 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'auto_refresh_enabled' not in st.session_state:
-    st.session_state.auto_refresh_enabled = False
-if 'completed_sessions' not in st.session_state:
-    st.session_state.completed_sessions = {}
-if 'show_connectivity_warning' not in st.session_state:
-    st.session_state.show_connectivity_warning = False
-if 'pending_electrumx_settings' not in st.session_state:
-    st.session_state.pending_electrumx_settings = None
-if 'test_connection_result' not in st.session_state:
-    st.session_state.test_connection_result = None
-if 'settings_save_success' not in st.session_state:
-    st.session_state.settings_save_success = False
-if 'show_full_address_list' not in st.session_state:
-    st.session_state.show_full_address_list = None  # Format: {'type': 'list_a' or 'list_b', 'checkpoint_id': str, 'addresses': list}
+st.session_state.setdefault('auto_refresh_enabled', False)
+st.session_state.setdefault('completed_sessions', {})
+st.session_state.setdefault('show_connectivity_warning', False)
+st.session_state.setdefault('pending_electrumx_settings', None)  # Format: {'changes': dict, 'host': str, 'port': int, 'error_message': str}
+st.session_state.setdefault('test_connection_result', None)
+st.session_state.setdefault('settings_save_success', False)
+st.session_state.setdefault('save_future', None)  # Pending background settings save (concurrent.futures.Future)
+st.session_state.setdefault('settings_save_error', None)
+st.session_state.setdefault('probe_cache', {})  # Format: {(host, port, use_ssl, cert): {'result': (success, error_message), 'ts': float}}
+st.session_state.setdefault('show_full_address_list', None)  # Format: {'type': 'list_a' or 'list_b', 'checkpoint_id': str, 'addresses': list}
 
 # Custom CSS
 st.markdown("""
@@ -76,10 +151,19 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Helper functions
+@st.cache_resource
+def get_api_session():
+    """Shared HTTP session so API calls reuse keep-alive connections across reruns"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+api_session = get_api_session()
+
 def get_sessions():
     """Fetch all active sessions"""
     try:
-        response = requests.get(f"{API_URL}/sessions", timeout=API_TIMEOUT)
+        response = api_session.get(f"{API_URL}/sessions", timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json().get('sessions', [])
     except requests.exceptions.Timeout:
@@ -92,7 +176,7 @@ def get_sessions():
 def get_checkpoints():
     """Fetch all available checkpoints"""
     try:
-        response = requests.get(f"{API_URL}/checkpoints/all", timeout=API_TIMEOUT)
+        response = api_session.get(f"{API_URL}/checkpoints/all", timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json().get('checkpoints', [])
     except requests.exceptions.Timeout:
@@ -105,7 +189,7 @@ def get_checkpoints():
 def get_session_details(session_id):
     """Fetch detailed status for a session"""
     try:
-        response = requests.get(f"{API_URL}/status/{session_id}", timeout=API_TIMEOUT)
+        response = api_session.get(f"{API_URL}/status/{session_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json()
     except requests.exceptions.Timeout:
@@ -125,7 +209,7 @@ def start_new_trace(list_a, list_b, max_depth, start_block, end_block):
             "start_block": start_block,
             "end_block": end_block
         }
-        response = requests.post(f"{API_URL}/trace", json=payload, timeout=API_TIMEOUT)
+        response = api_session.post(f"{API_URL}/trace", json=payload, timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         else:
@@ -137,7 +221,7 @@ def start_new_trace(list_a, list_b, max_depth, start_block, end_block):
 def cancel_session(session_id):
     """Cancel a running session"""
     try:
-        response = requests.post(f"{API_URL}/cancel/{session_id}", timeout=API_TIMEOUT)
+        response = api_session.post(f"{API_URL}/cancel/{session_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             st.success(f"Cancellation requested!")
             return True
@@ -160,7 +244,7 @@ def cancel_all_running_sessions():
     for session in running_sessions:
         session_id = session['session_id']
         try:
-            response = requests.post(f"{API_URL}/cancel/{session_id}", timeout=API_TIMEOUT)
+            response = api_session.post(f"{API_URL}/cancel/{session_id}", timeout=API_TIMEOUT)
             if response.status_code == 200:
                 cancelled_count += 1
             else:
@@ -192,7 +276,7 @@ def force_checkpoint_all_running_sessions():
     for session in running_sessions:
         session_id = session['session_id']
         try:
-            response = requests.post(f"{API_URL}/checkpoint/{session_id}/force", timeout=API_TIMEOUT)
+            response = api_session.post(f"{API_URL}/checkpoint/{session_id}/force", timeout=API_TIMEOUT)
             if response.status_code == 200:
                 result = response.json()
                 checkpointed_count += 1
@@ -218,10 +302,10 @@ def force_checkpoint_all_running_sessions():
 def resume_auto():
     """Auto-resume from most recent checkpoint"""
     try:
-        response = requests.post(f"{API_URL}/resume/auto", timeout=API_TIMEOUT)
+        response = api_session.post(f"{API_URL}/resume/auto", timeout=API_TIMEOUT)
         if response.status_code == 200:
             result = response.json()
-            st.success(f"Resumed! New session: {result['session_id'][:8]}...")
+            st.toast(f"✅ Resumed! New session: {result['session_id'][:8]}...")
             return result
         else:
             st.error("No checkpoints available")
@@ -232,7 +316,7 @@ def resume_auto():
 def delete_session(session_id):
     """Delete a session"""
     try:
-        response = requests.delete(f"{API_URL}/sessions/{session_id}", timeout=API_TIMEOUT)
+        response = api_session.delete(f"{API_URL}/sessions/{session_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             st.success("Deleted")
             return True
@@ -243,7 +327,7 @@ def delete_session(session_id):
 def delete_checkpoint(session_id, checkpoint_id):
     """Delete a checkpoint"""
     try:
-        response = requests.delete(f"{API_URL}/checkpoints/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
+        response = api_session.delete(f"{API_URL}/checkpoints/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             st.success("Checkpoint deleted")
             return True
@@ -256,7 +340,7 @@ def delete_checkpoint(session_id, checkpoint_id):
 def get_checkpoint_details(session_id, checkpoint_id):
     """Get detailed checkpoint information"""
     try:
-        response = requests.get(f"{API_URL}/checkpoint/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
+        response = api_session.get(f"{API_URL}/checkpoint/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         else:
@@ -268,10 +352,10 @@ def get_checkpoint_details(session_id, checkpoint_id):
 def resume_from_checkpoint(session_id, checkpoint_id):
     """Resume from a specific checkpoint"""
     try:
-        response = requests.post(f"{API_URL}/resume/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
+        response = api_session.post(f"{API_URL}/resume/{session_id}/{checkpoint_id}", timeout=API_TIMEOUT)
         if response.status_code == 200:
             result = response.json()
-            st.success(f"Resumed! New session: {result['session_id'][:8]}...")
+            st.toast(f"✅ Resumed! New session: {result['session_id'][:8]}...")
             return result
         else:
             st.error(f"Failed to resume: {response.text}")
@@ -300,10 +384,62 @@ def load_checkpoint_data(session_id, checkpoint_id):
         st.error(f"Error loading checkpoint: {e}")
     return None
 
+def get_dir_mtime(path):
+    """Return a directory's mtime (changes when files are added or removed), or None if missing"""
+    try:
+        return Path(path).stat().st_mtime
+    except OSError:
+        return None
+
+def get_cached_scan(cache_key, fingerprint, compute):
+    """
+    Return compute(), reusing the result stored in st.session_state[cache_key]
+    while its fingerprint is unchanged and it is younger than CLEANUP_SCAN_TTL
+    """
+    cached = st.session_state.get(cache_key)
+    if cached and cached['fingerprint'] == fingerprint and time.time() - cached['ts'] < CLEANUP_SCAN_TTL:
+        return cached['result']
+    
+    result = compute()
+    st.session_state[cache_key] = {'fingerprint': fingerprint, 'ts': time.time(), 'result': result}
+    return result
+
+def open_noatime(path):
+    """
+    Open a file read-only without updating its access time (Linux O_NOATIME)
+    
+    Returns a raw file descriptor. O_NOATIME is only permitted for the file's owner,
+    so fall back to a plain read-only open elsewhere.
+    """
+    # O_BINARY (Windows only) keeps the fd out of text mode for the 'rb' fdopen
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+    noatime = getattr(os, 'O_NOATIME', 0)
+    if noatime:
+        try:
+            return os.open(path, flags | noatime)
+        except PermissionError:
+            pass
+    return os.open(path, flags)
+
+def export_has_connections(json_path):
+    """
+    Check whether an export JSON has at least one entry in 'connections_found'
+    
+    Large files are streamed with ijson (when installed) and stop at the first
+    connection instead of parsing the whole document.
+    """
+    json_path = Path(json_path)
+    if ijson is None or json_path.stat().st_size <= SMALL_EXPORT_BYTES:
+        with os.fdopen(open_noatime(json_path), 'r', encoding='utf-8') as f:
+            return len(json.load(f).get('connections_found', [])) > 0
+    
+    with os.fdopen(open_noatime(json_path), 'rb') as f:
+        return next(ijson.items(f, 'connections_found.item'), None) is not None
+
 def get_settings():
     """Fetch current settings from API"""
     try:
-        response = requests.get(f"{API_URL}/settings", timeout=API_TIMEOUT)
+        response = api_session.get(f"{API_URL}/settings", timeout=API_TIMEOUT)
         if response.status_code == 200:
             return response.json()
     except requests.exceptions.Timeout:
@@ -445,63 +581,226 @@ def test_electrumx_connectivity(host, port, use_ssl=False, cert=None, timeout=5)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
-def save_settings(default_api=None, mempool_api_key=None, electrumx_host=None, electrumx_port=None, electrumx_use_ssl=None, electrumx_cert=None, use_cache=None,
-                  mixer_input_threshold=None, mixer_output_threshold=None, suspicious_ratio_threshold=None,
-                  skip_mixer_input_threshold=None, skip_mixer_output_threshold=None,
-                  skip_distribution_max_inputs=None, skip_distribution_min_outputs=None,
-                  max_transactions_per_address=None, max_depth=None, exchange_wallet_threshold=None,
-                  max_input_addresses_per_tx=None, max_output_addresses_per_tx=None):
-    """Save settings to API"""
+def test_electrumx_connectivity_cached(host, port, use_ssl=False, cert=None, timeout=5, force=False):
+    """
+    Test ElectrumX server connectivity, reusing a recent result for the same connection fields
+    
+    Results are kept in st.session_state.probe_cache so repeat saves don't re-issue the
+    blocking socket probe: successes for PROBE_SUCCESS_TTL seconds, failures for
+    PROBE_CACHE_TTL seconds so a fixed server is picked up quickly. With force=True
+    (the explicit Test Connection button) the cache is skipped and refreshed.
+    
+    Returns:
+        Tuple of (success: bool, error_message: str)
+    """
+    probe_key = (host, port, use_ssl, cert)
+    cached = None if force else st.session_state.probe_cache.get(probe_key)
+    if cached:
+        ttl = PROBE_SUCCESS_TTL if cached['result'][0] else PROBE_CACHE_TTL
+        if time.time() - cached['ts'] < ttl:
+            return cached['result']
+    
+    result = test_electrumx_connectivity(host, port, use_ssl, cert, timeout=timeout)
+    st.session_state.probe_cache[probe_key] = {'result': result, 'ts': time.time()}
+    return result
+
+def build_settings_payload(default_api=None, mempool_api_key=None, electrumx_host=None, electrumx_port=None, electrumx_use_ssl=None, electrumx_cert=None, use_cache=None,
+                           mixer_input_threshold=None, mixer_output_threshold=None, suspicious_ratio_threshold=None,
+                           skip_mixer_input_threshold=None, skip_mixer_output_threshold=None,
+                           skip_distribution_max_inputs=None, skip_distribution_min_outputs=None,
+                           max_transactions_per_address=None, max_depth=None, exchange_wallet_threshold=None,
+                           max_input_addresses_per_tx=None, max_output_addresses_per_tx=None):
+    """Build the settings update payload, leaving out fields that are not being changed (None)"""
+    fields = (
+        ('default_api', default_api),
+        ('mempool_api_key', mempool_api_key),
+        ('electrumx_host', electrumx_host),
+        ('electrumx_port', electrumx_port),
+        ('electrumx_use_ssl', electrumx_use_ssl),
+        ('electrumx_cert', electrumx_cert),
+        ('use_cache', use_cache),
+        ('mixer_input_threshold', mixer_input_threshold),
+        ('mixer_output_threshold', mixer_output_threshold),
+        ('suspicious_ratio_threshold', suspicious_ratio_threshold),
+        ('skip_mixer_input_threshold', skip_mixer_input_threshold),
+        ('skip_mixer_output_threshold', skip_mixer_output_threshold),
+        ('skip_distribution_max_inputs', skip_distribution_max_inputs),
+        ('skip_distribution_min_outputs', skip_distribution_min_outputs),
+        ('max_transactions_per_address', max_transactions_per_address),
+        ('max_depth', max_depth),
+        ('exchange_wallet_threshold', exchange_wallet_threshold),
+        ('max_input_addresses_per_tx', max_input_addresses_per_tx),
+        ('max_output_addresses_per_tx', max_output_addresses_per_tx)
+    )
+    return {key: value for key, value in fields if value is not None}
+
+def post_settings(payload):
+    """
+    POST a settings payload to the API without touching the Streamlit UI
+    
+    Safe to run on a worker thread (see save_settings_in_background).
+    
+    Returns:
+        Tuple of (result: dict or None, error_message: str or None)
+    """
     try:
-        payload = {}
-        if default_api is not None:
-            payload['default_api'] = default_api
-        if mempool_api_key is not None:
-            payload['mempool_api_key'] = mempool_api_key
-        if electrumx_host is not None:
-            payload['electrumx_host'] = electrumx_host
-        if electrumx_port is not None:
-            payload['electrumx_port'] = electrumx_port
-        if electrumx_use_ssl is not None:
-            payload['electrumx_use_ssl'] = electrumx_use_ssl
-        if electrumx_cert is not None:
-            payload['electrumx_cert'] = electrumx_cert
-        if use_cache is not None:
-            payload['use_cache'] = use_cache
-        # Threshold settings
-        if mixer_input_threshold is not None:
-            payload['mixer_input_threshold'] = mixer_input_threshold
-        if mixer_output_threshold is not None:
-            payload['mixer_output_threshold'] = mixer_output_threshold
-        if suspicious_ratio_threshold is not None:
-            payload['suspicious_ratio_threshold'] = suspicious_ratio_threshold
-        if skip_mixer_input_threshold is not None:
-            payload['skip_mixer_input_threshold'] = skip_mixer_input_threshold
-        if skip_mixer_output_threshold is not None:
-            payload['skip_mixer_output_threshold'] = skip_mixer_output_threshold
-        if skip_distribution_max_inputs is not None:
-            payload['skip_distribution_max_inputs'] = skip_distribution_max_inputs
-        if skip_distribution_min_outputs is not None:
-            payload['skip_distribution_min_outputs'] = skip_distribution_min_outputs
-        if max_transactions_per_address is not None:
-            payload['max_transactions_per_address'] = max_transactions_per_address
-        if max_depth is not None:
-            payload['max_depth'] = max_depth
-        if exchange_wallet_threshold is not None:
-            payload['exchange_wallet_threshold'] = exchange_wallet_threshold
-        if max_input_addresses_per_tx is not None:
-            payload['max_input_addresses_per_tx'] = max_input_addresses_per_tx
-        if max_output_addresses_per_tx is not None:
-            payload['max_output_addresses_per_tx'] = max_output_addresses_per_tx
-        
-        response = requests.post(f"{API_URL}/settings", json=payload, timeout=API_TIMEOUT)
+        response = api_session.post(f"{API_URL}/settings", json=payload, timeout=API_TIMEOUT)
         if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Failed to save settings: {response.text}")
+            return response.json(), None
+        return None, f"Failed to save settings: {response.text}"
     except Exception as e:
-        st.error(f"Error saving settings: {e}")
-    return None
+        return None, f"Error saving settings: {e}"
+
+def save_settings(**settings):
+    """Save settings to API"""
+    payload = build_settings_payload(**settings)
+    
+    # Nothing to update, skip the backend round-trip
+    if not payload:
+        st.info("No changes to save")
+        return None
+    
+    result, error_message = post_settings(payload)
+    if error_message:
+        st.error(error_message)
+    return result
+
+@st.cache_resource
+def get_settings_executor():
+    """Thread pool shared by all sessions for background settings saves"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def save_settings_in_background(**settings):
+    """
+    Submit a settings save to the worker pool instead of blocking the script thread
+    
+    The future is kept in st.session_state.save_future and picked up by
+    settings_save_status() on a later run.
+    
+    Returns:
+        The submitted Future, or None if there was nothing to save
+    """
+    payload = build_settings_payload(**settings)
+    if not payload:
+        st.info("No changes to save")
+        return None
+    
+    future = get_settings_executor().submit(post_settings, payload)
+    st.session_state.save_future = future
+    return future
+
+def settings_save_status():
+    """Report a background settings save, rerunning the app once it has finished"""
+    future = st.session_state.save_future
+    if not future.done():
+        if fragment_decorator:
+            # The fragment polls on its own schedule until the save completes
+            st.info("Saving settings...")
+            return
+        with st.spinner("Saving settings..."):
+            wait([future])
+    
+    result, error_message = future.result()
+    st.session_state.update({
+        'save_future': None,
+        'settings_save_error': error_message,
+        'test_connection_result': None if result else st.session_state.test_connection_result,
+        'settings_save_success': bool(result)
+    })
+    st.rerun()
+
+if fragment_decorator:
+    settings_save_status = fragment_decorator(run_every=1)(settings_save_status)
+
+def electrumx_test_fragment(host, port, use_ssl, cert):
+    """Render the ElectrumX Test Connection button and its result banner"""
+    col_test1, col_test2 = st.columns([1, 3])
+    with col_test1:
+        if st.button("Test Connection", key="test_electrumx_connection", width='stretch', type="secondary"):
+            if host and port:
+                with st.spinner("Testing connection..."):
+                    # Always probe live: the user is asking about the server's state right now
+                    success, error_message = test_electrumx_connectivity_cached(
+                        host,
+                        port,
+                        use_ssl,
+                        cert if cert else None,
+                        timeout=5,
+                        force=True
+                    )
+                    st.session_state.test_connection_result = {
+                        'success': success,
+                        'error_message': error_message,
+                        'host': host,
+                        'port': port
+                    }
+            else:
+                st.session_state.test_connection_result = {
+                    'success': False,
+                    'error_message': 'Host and port must be provided',
+                    'host': host or 'N/A',
+                    'port': port or 'N/A'
+                }
+            rerun_fragment()
+    
+    # Display test connection result
+    if st.session_state.test_connection_result:
+        result = st.session_state.test_connection_result
+        if result.get('host') == host and result.get('port') == port:
+            if result.get('success'):
+                st.success(f"✅ Connection successful! Server at `{result.get('host')}:{result.get('port')}` is reachable and responding.")
+            else:
+                st.error(f"❌ Connection failed: {result.get('error_message', 'Unknown error')}")
+        else:
+            # Result is for different host/port, clear it
+            st.session_state.test_connection_result = None
+
+if fragment_decorator:
+    electrumx_test_fragment = fragment_decorator(electrumx_test_fragment)
+
+def connectivity_warning_dialog():
+    """Render the ElectrumX connectivity warning with Save Anyway / Cancel actions"""
+    st.error("⚠️ **ElectrumX Server Connectivity Warning**")
+    pending = st.session_state.pending_electrumx_settings
+    error_msg = pending.get('error_message', 'Unknown error')
+    
+    st.warning(f"""
+**Server is not reachable:**
+- Host: `{pending.get('host', 'N/A')}`
+- Port: `{pending.get('port', 'N/A')}`
+- Error: {error_msg}
+
+You can still save these settings, but the server may not be accessible when using ElectrumX provider.
+    """)
+    
+    col_warn1, col_warn2 = st.columns(2)
+    with col_warn1:
+        if st.button("Save Anyway", key="save_anyway", width='stretch', type="secondary"):
+            # Proceed with save using pending settings
+            pending = st.session_state.pending_electrumx_settings
+            result = save_settings(**pending['changes'])
+            # Clear warning state and test connection result (avoids duplicates) in one write
+            st.session_state.update({
+                'show_connectivity_warning': False,
+                'pending_electrumx_settings': None,
+                'test_connection_result': None,
+                'settings_save_success': bool(result)
+            })
+            if result:
+                st.rerun()
+    with col_warn2:
+        if st.button("Cancel", key="cancel_save", width='stretch', type="primary"):
+            # Clear warning state and pending settings
+            st.session_state.update({
+                'show_connectivity_warning': False,
+                'pending_electrumx_settings': None
+            })
+            st.rerun()
+    
+    st.divider()
+
+if fragment_decorator:
+    connectivity_warning_dialog = fragment_decorator(connectivity_warning_dialog)
 
 # Header
 st.title("Bitcoin Address Linker")
@@ -528,7 +827,7 @@ with st.sidebar:
         
         if st.button("Test API", width='stretch'):
             try:
-                response = requests.get(f"{API_URL}/sessions", timeout=5)
+                response = api_session.get(f"{API_URL}/sessions", timeout=5)
                 if response.status_code == 200:
                     st.success("API OK")
                 else:
@@ -757,7 +1056,7 @@ with tab1:
                         if status == 'completed':
                             if st.button("Results", key=f"results_{session_id}", width='stretch', type="secondary"):
                                 try:
-                                    results = requests.get(f"{API_URL}/results/{session_id}", timeout=API_TIMEOUT).json()
+                                    results = api_session.get(f"{API_URL}/results/{session_id}", timeout=API_TIMEOUT).json()
                                     st.json(results)
                                 except Exception as e:
                                     st.error(f"Error: {e}")
@@ -836,8 +1135,7 @@ with tab2:
                     end_block_param = end_block if end_block < 999999999 else None
                     result = start_new_trace(list_a, list_b, max_depth, start_block_param, end_block_param)
                     if result:
-                        st.success(f"Started! Session: {result['session_id'][:8]}...")
-                        time.sleep(1)
+                        st.toast(f"✅ Started! Session: {result['session_id'][:8]}...")
                         st.rerun()
         
         with col2:
@@ -875,7 +1173,6 @@ with tab3:
             with st.spinner("Resuming..."):
                 result = resume_auto()
                 if result:
-                    time.sleep(1)
                     st.rerun()
         
         st.divider()
@@ -1135,7 +1432,6 @@ with tab3:
                         with st.spinner("Resuming..."):
                             result = resume_from_checkpoint(cp['session_id'], cp['checkpoint_id'])
                             if result:
-                                time.sleep(1)
                                 st.rerun()
             
             with col_delete:
@@ -1341,10 +1637,38 @@ with tab5:
     st.header("Settings")
     st.markdown("Configure API provider and authentication")
     
+    # Finish a background save started on a previous run before fetching settings
+    if st.session_state.save_future is not None:
+        settings_save_status()
+    
     # Fetch current settings
     current_settings = get_settings()
     
     if current_settings:
+        # Unpack current values once; reused by the widgets and the save diff below
+        current_provider = current_settings.get('default_api', 'mempool')
+        current_host = current_settings.get('electrumx_host', '')
+        # Port/SSL are stored as raw strings ('' when unset). Coerce them once for the widgets,
+        # but diff the form against the stored strings so an unset value is written on save
+        stored_port = str(current_settings.get('electrumx_port') or '')
+        stored_use_ssl = str(current_settings.get('electrumx_use_ssl') or '').lower()
+        current_port = int(stored_port) if stored_port.isdigit() else 50001
+        current_use_ssl = stored_use_ssl == 'true'
+        current_cert = current_settings.get('electrumx_cert', '')
+        current_use_cache = current_settings.get('use_cache', True)
+        current_mixer_input = current_settings.get('mixer_input_threshold', 30)
+        current_mixer_output = current_settings.get('mixer_output_threshold', 30)
+        current_suspicious_ratio = current_settings.get('suspicious_ratio_threshold', 10)
+        current_skip_mixer_input = current_settings.get('skip_mixer_input_threshold', 50)
+        current_skip_mixer_output = current_settings.get('skip_mixer_output_threshold', 50)
+        current_skip_dist_max_inputs = current_settings.get('skip_distribution_max_inputs', 2)
+        current_skip_dist_min_outputs = current_settings.get('skip_distribution_min_outputs', 100)
+        current_max_tx_per_addr = current_settings.get('max_transactions_per_address', 50)
+        current_max_depth = current_settings.get('max_depth', 10)
+        current_exchange_threshold = current_settings.get('exchange_wallet_threshold', 1000)
+        current_max_input_addrs = current_settings.get('max_input_addresses_per_tx', 50)
+        current_max_output_addrs = current_settings.get('max_output_addresses_per_tx', 50)
+        
         st.divider()
         
         # API Provider Selection
@@ -1357,8 +1681,6 @@ with tab5:
             'electrumx': 'ElectrumX (Self-hosted)'
         }
         
-        current_provider = current_settings.get('default_api', 'mempool')
-        
         # Find index of current provider
         provider_keys = list(provider_options.keys())
         current_index = provider_keys.index(current_provider) if current_provider in provider_keys else 0
@@ -1412,12 +1734,6 @@ with tab5:
             st.subheader("ElectrumX Server Configuration")
             st.markdown("Configure your ElectrumX server connection details")
             
-            # Get current values or defaults
-            current_host = current_settings.get('electrumx_host', '')
-            current_port = current_settings.get('electrumx_port', '50001')
-            current_use_ssl = current_settings.get('electrumx_use_ssl', 'false').lower() == 'true'
-            current_cert = current_settings.get('electrumx_cert', '')
-            
             col1, col2 = st.columns(2)
             
             with col1:
@@ -1434,7 +1750,7 @@ with tab5:
                     "Server Port",
                     min_value=1,
                     max_value=65535,
-                    value=int(current_port) if current_port.isdigit() else 50001,
+                    value=current_port,
                     key="settings_electrumx_port",
                     help="Port number (50001 for TCP, 50002 for SSL)"
                 )
@@ -1456,52 +1772,14 @@ with tab5:
             
             # Test Connection button
             st.divider()
-            col_test1, col_test2 = st.columns([1, 3])
-            with col_test1:
-                if st.button("Test Connection", key="test_electrumx_connection", width='stretch', type="secondary"):
-                    if electrumx_host and electrumx_port:
-                        with st.spinner("Testing connection..."):
-                            success, error_message = test_electrumx_connectivity(
-                                electrumx_host,
-                                electrumx_port,
-                                electrumx_use_ssl,
-                                electrumx_cert if electrumx_cert else None,
-                                timeout=5
-                            )
-                            st.session_state.test_connection_result = {
-                                'success': success,
-                                'error_message': error_message,
-                                'host': electrumx_host,
-                                'port': electrumx_port
-                            }
-                            st.rerun()
-                    else:
-                        st.session_state.test_connection_result = {
-                            'success': False,
-                            'error_message': 'Host and port must be provided',
-                            'host': electrumx_host or 'N/A',
-                            'port': electrumx_port or 'N/A'
-                        }
-                        st.rerun()
-            
-            # Display test connection result
-            if st.session_state.test_connection_result:
-                result = st.session_state.test_connection_result
-                if result.get('host') == electrumx_host and result.get('port') == electrumx_port:
-                    if result.get('success'):
-                        st.success(f"✅ Connection successful! Server at `{result.get('host')}:{result.get('port')}` is reachable and responding.")
-                    else:
-                        st.error(f"❌ Connection failed: {result.get('error_message', 'Unknown error')}")
-                else:
-                    # Result is for different host/port, clear it
-                    st.session_state.test_connection_result = None
+            electrumx_test_fragment(electrumx_host, electrumx_port, electrumx_use_ssl, electrumx_cert)
         else:
             electrumx_host = None
             electrumx_port = None
             electrumx_use_ssl = None
             electrumx_cert = None
             # Clear test result when not on ElectrumX tab
-            if st.session_state.test_connection_result:
+            if st.session_state.test_connection_result is not None:
                 st.session_state.test_connection_result = None
         
         st.divider()
@@ -1510,12 +1788,11 @@ with tab5:
         st.subheader("Cache Settings")
         st.markdown("Enable or disable transaction caching for troubleshooting")
         
-        current_use_cache = current_settings.get('use_cache', True)
         use_cache = st.checkbox(
             "Enable Transaction Cache",
             value=current_use_cache,
             key="settings_use_cache",
-            help="When enabled, transactions are cached to speed up subsequent searches. Disable to bypass cache for troubleshooting (e.g., if connections are not being found). Note: Server restart may be required for this setting to take effect."
+            help=HELP_USE_CACHE
         )
         
         if not use_cache:
@@ -1531,43 +1808,13 @@ with tab5:
         col_reset1, col_reset2 = st.columns([1, 4])
         with col_reset1:
             if st.button("🔄 Reset to Suggested Values", key="reset_thresholds", type="secondary", help="Reset all tracing thresholds to their suggested default values"):
-                # Suggested/default values
-                suggested_values = {
-                    'mixer_input_threshold': 30,
-                    'mixer_output_threshold': 30,
-                    'suspicious_ratio_threshold': 10,
-                    'skip_mixer_input_threshold': 50,
-                    'skip_mixer_output_threshold': 50,
-                    'skip_distribution_max_inputs': 2,
-                    'skip_distribution_min_outputs': 100,
-                    'max_transactions_per_address': 50,
-                    'max_depth': 10,
-                    'exchange_wallet_threshold': 1000,
-                    'max_input_addresses_per_tx': 50,
-                    'max_output_addresses_per_tx': 50
-                }
-                
                 # Save immediately
                 with st.spinner("Resetting to suggested values..."):
-                    result = save_settings(
-                        mixer_input_threshold=suggested_values['mixer_input_threshold'],
-                        mixer_output_threshold=suggested_values['mixer_output_threshold'],
-                        suspicious_ratio_threshold=suggested_values['suspicious_ratio_threshold'],
-                        skip_mixer_input_threshold=suggested_values['skip_mixer_input_threshold'],
-                        skip_mixer_output_threshold=suggested_values['skip_mixer_output_threshold'],
-                        skip_distribution_max_inputs=suggested_values['skip_distribution_max_inputs'],
-                        skip_distribution_min_outputs=suggested_values['skip_distribution_min_outputs'],
-                        max_transactions_per_address=suggested_values['max_transactions_per_address'],
-                        max_depth=suggested_values['max_depth'],
-                        exchange_wallet_threshold=suggested_values['exchange_wallet_threshold'],
-                        max_input_addresses_per_tx=suggested_values['max_input_addresses_per_tx'],
-                        max_output_addresses_per_tx=suggested_values['max_output_addresses_per_tx']
-                    )
+                    result = save_settings(**SUGGESTED_THRESHOLDS)
                     
                     if result:
                         st.session_state.settings_save_success = True
-                        st.success("✅ All thresholds reset to suggested values!")
-                        time.sleep(1)
+                        st.toast("✅ All thresholds reset to suggested values!")
                         st.rerun()
                     else:
                         st.error("Failed to reset thresholds")
@@ -1577,439 +1824,303 @@ with tab5:
         
         st.divider()
         
-        # Get current threshold values from settings
-        current_mixer_input = current_settings.get('mixer_input_threshold', 30)
-        current_mixer_output = current_settings.get('mixer_output_threshold', 30)
-        current_suspicious_ratio = current_settings.get('suspicious_ratio_threshold', 10)
-        current_skip_mixer_input = current_settings.get('skip_mixer_input_threshold', 50)
-        current_skip_mixer_output = current_settings.get('skip_mixer_output_threshold', 50)
-        current_skip_dist_max_inputs = current_settings.get('skip_distribution_max_inputs', 2)
-        current_skip_dist_min_outputs = current_settings.get('skip_distribution_min_outputs', 100)
-        current_max_tx_per_addr = current_settings.get('max_transactions_per_address', 50)
-        current_max_depth = current_settings.get('max_depth', 10)
-        current_exchange_threshold = current_settings.get('exchange_wallet_threshold', 1000)
-        current_max_input_addrs = current_settings.get('max_input_addresses_per_tx', 50)
-        current_max_output_addrs = current_settings.get('max_output_addresses_per_tx', 50)
-        
-        # Mixer Detection Thresholds
-        with st.expander("Mixer Detection Thresholds", expanded=False):
-            st.markdown("""
-            **Purpose:** Identify mixer-like transactions that have many inputs and/or outputs.
-            These thresholds help detect privacy-focused transactions that may not be useful for tracing connections.
-            """)
-            
-            st.info("💡 **Suggested Values:** Input: 30, Output: 30, Ratio: 10 | These values are based on typical CoinJoin/mixer patterns where transactions have 30+ inputs/outputs. The ratio of 10 catches extreme imbalances (e.g., 1:10 or 10:1) that indicate suspicious patterns.")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                mixer_input_threshold = st.number_input(
-                    "Mixer Input Threshold",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_mixer_input,
-                    key="settings_mixer_input",
-                    help="Minimum number of inputs to be considered 'mixer-like'. Transactions with this many or more inputs are flagged as potential mixers. Suggested: 30 (typical CoinJoin size)."
-                )
-            
-            with col2:
-                mixer_output_threshold = st.number_input(
-                    "Mixer Output Threshold",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_mixer_output,
-                    key="settings_mixer_output",
-                    help="Minimum number of outputs to be considered 'mixer-like'. Transactions with this many or more outputs are flagged as potential mixers. Suggested: 30 (typical CoinJoin size)."
-                )
-            
-            suspicious_ratio_threshold = st.number_input(
-                "Suspicious Ratio Threshold",
-                min_value=1,
-                max_value=100,
-                value=current_suspicious_ratio,
-                key="settings_suspicious_ratio",
-                help="Input:output or output:input ratio to flag as suspicious. Transactions with extreme ratios (e.g., 1 input to 100 outputs) are flagged. Suggested: 10 (catches 10:1 or 1:10 imbalances)."
-            )
-        
-        # Transaction Filtering Thresholds
-        with st.expander("Transaction Filtering Thresholds", expanded=False):
-            st.markdown("""
-            **Purpose:** Filter out extreme mixer transactions that would flood the processing queue.
-            These transactions are skipped entirely to improve performance and focus on meaningful connections.
-            """)
-            
-            st.info("💡 **Suggested Values:** Input: 50, Output: 50 | These values filter out extreme mixers (50+ inputs/outputs) that would create thousands of queue entries. This threshold is higher than the detection threshold (30) to allow some mixer analysis while preventing queue flooding from massive CoinJoin transactions.")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                skip_mixer_input_threshold = st.number_input(
-                    "Skip Mixer Input Threshold",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_skip_mixer_input,
-                    key="settings_skip_mixer_input",
-                    help="Minimum inputs for extreme mixer. Transactions with this many or more inputs are completely skipped (prevents queue flooding). Suggested: 50 (filters extreme mixers while allowing smaller ones)."
-                )
-            
-            with col2:
-                skip_mixer_output_threshold = st.number_input(
-                    "Skip Mixer Output Threshold",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_skip_mixer_output,
-                    key="settings_skip_mixer_output",
-                    help="Minimum outputs for extreme mixer. Transactions with this many or more outputs are completely skipped (prevents queue flooding). Suggested: 50 (filters extreme mixers while allowing smaller ones)."
-                )
-        
-        # Airdrop/Distribution Detection
-        with st.expander("Airdrop/Distribution Detection (MOST IMPORTANT)", expanded=True):
-            st.markdown("""
-            **Purpose:** Filter out airdrop and distribution transactions that create false connections.
-            
-            **Why this is critical:** Airdrop transactions typically have 1-2 inputs and hundreds of outputs, 
-            connecting many unrelated addresses. These create false positive connections and should be filtered out.
-            """)
-            
-            st.warning("💡 **Suggested Values:** Max Inputs: 2, Min Outputs: 100 | Most airdrops have 1-2 inputs (single funding source) and 100+ outputs (many recipients). This pattern (few inputs, many outputs) is the signature of distribution transactions. Setting max inputs to 2 catches 99% of airdrops while allowing legitimate multi-input transactions. The 100 output threshold ensures we only filter true distributions, not normal transactions with many outputs.")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                skip_distribution_max_inputs = st.number_input(
-                    "Max Inputs for Distribution",
+        # Thresholds and the Save button share a form, so editing a value doesn't rerun the
+        # script; the diff-and-save block below only runs once the form is submitted
+        with st.form("settings_form", border=False):
+            # Mixer Detection Thresholds
+            with st.expander("Mixer Detection Thresholds", expanded=False):
+                st.markdown("""
+                **Purpose:** Identify mixer-like transactions that have many inputs and/or outputs.
+                These thresholds help detect privacy-focused transactions that may not be useful for tracing connections.
+                """)
+                
+                st.info(TIP_MIXER_DETECTION)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    mixer_input_threshold = st.number_input(
+                        "Mixer Input Threshold",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_mixer_input,
+                        key="settings_mixer_input",
+                        help=HELP_MIXER_INPUT
+                    )
+                
+                with col2:
+                    mixer_output_threshold = st.number_input(
+                        "Mixer Output Threshold",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_mixer_output,
+                        key="settings_mixer_output",
+                        help=HELP_MIXER_OUTPUT
+                    )
+                
+                suspicious_ratio_threshold = st.number_input(
+                    "Suspicious Ratio Threshold",
                     min_value=1,
-                    max_value=10,
-                    value=current_skip_dist_max_inputs,
-                    key="settings_skip_dist_max_inputs",
-                    help="Maximum number of inputs to trigger distribution filter. Transactions with this many or fewer inputs AND the minimum outputs are considered distributions. Suggested: 2 (most airdrops have 1-2 inputs)."
+                    max_value=100,
+                    value=current_suspicious_ratio,
+                    key="settings_suspicious_ratio",
+                    help=HELP_SUSPICIOUS_RATIO
                 )
             
-            with col2:
-                skip_distribution_min_outputs = st.number_input(
-                    "Min Outputs for Distribution",
-                    min_value=10,
-                    max_value=10000,
-                    value=current_skip_dist_min_outputs,
-                    key="settings_skip_dist_min_outputs",
-                    help="Minimum number of outputs to trigger distribution filter. Transactions with max inputs AND this many or more outputs are skipped. Suggested: 100 (catches airdrops while allowing normal transactions)."
-                )
-        
-        # Processing Limits
-        with st.expander("Processing Limits", expanded=False):
-            st.markdown("""
-            **Purpose:** Limit processing to prevent resource exhaustion and focus on relevant transactions.
-            """)
+            # Transaction Filtering Thresholds
+            with st.expander("Transaction Filtering Thresholds", expanded=False):
+                st.markdown("""
+                **Purpose:** Filter out extreme mixer transactions that would flood the processing queue.
+                These transactions are skipped entirely to improve performance and focus on meaningful connections.
+                """)
+                
+                st.info(TIP_TX_FILTERING)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    skip_mixer_input_threshold = st.number_input(
+                        "Skip Mixer Input Threshold",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_skip_mixer_input,
+                        key="settings_skip_mixer_input",
+                        help=HELP_SKIP_MIXER_INPUT
+                    )
+                
+                with col2:
+                    skip_mixer_output_threshold = st.number_input(
+                        "Skip Mixer Output Threshold",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_skip_mixer_output,
+                        key="settings_skip_mixer_output",
+                        help=HELP_SKIP_MIXER_OUTPUT
+                    )
             
-            st.info("💡 **Suggested Values:** Max TX/Address: 50, Max Depth: 10, Exchange Threshold: 1000 | Limiting to 50 transactions per address balances thoroughness with performance. Depth of 10 allows tracing through multiple hops while preventing infinite loops. Exchange threshold of 1000 identifies high-volume addresses (exchanges, services) that aren't useful for tracing individual connections.")
+            # Airdrop/Distribution Detection
+            with st.expander("Airdrop/Distribution Detection (MOST IMPORTANT)", expanded=True):
+                st.markdown("""
+                **Purpose:** Filter out airdrop and distribution transactions that create false connections.
+                
+                **Why this is critical:** Airdrop transactions typically have 1-2 inputs and hundreds of outputs, 
+                connecting many unrelated addresses. These create false positive connections and should be filtered out.
+                """)
+                
+                st.warning(TIP_DISTRIBUTION)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    skip_distribution_max_inputs = st.number_input(
+                        "Max Inputs for Distribution",
+                        min_value=1,
+                        max_value=10,
+                        value=current_skip_dist_max_inputs,
+                        key="settings_skip_dist_max_inputs",
+                        help=HELP_SKIP_DIST_MAX_INPUTS
+                    )
+                
+                with col2:
+                    skip_distribution_min_outputs = st.number_input(
+                        "Min Outputs for Distribution",
+                        min_value=10,
+                        max_value=10000,
+                        value=current_skip_dist_min_outputs,
+                        key="settings_skip_dist_min_outputs",
+                        help=HELP_SKIP_DIST_MIN_OUTPUTS
+                    )
             
-            col1, col2 = st.columns(2)
-            with col1:
-                max_transactions_per_address = st.number_input(
-                    "Max Transactions Per Address",
-                    min_value=1,
-                    max_value=10000,
-                    value=current_max_tx_per_addr,
-                    key="settings_max_tx_per_addr",
-                    help="Maximum number of transactions to process per address. Addresses with more transactions are limited to this number. Suggested: 50 (balances thoroughness with performance)."
+            # Processing Limits
+            with st.expander("Processing Limits", expanded=False):
+                st.markdown("""
+                **Purpose:** Limit processing to prevent resource exhaustion and focus on relevant transactions.
+                """)
+                
+                st.info(TIP_PROCESSING_LIMITS)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    max_transactions_per_address = st.number_input(
+                        "Max Transactions Per Address",
+                        min_value=1,
+                        max_value=10000,
+                        value=current_max_tx_per_addr,
+                        key="settings_max_tx_per_addr",
+                        help=HELP_MAX_TX_PER_ADDR
+                    )
+                
+                with col2:
+                    max_depth = st.number_input(
+                        "Max Tracing Depth",
+                        min_value=1,
+                        max_value=50,
+                        value=current_max_depth,
+                        key="settings_max_depth",
+                        help=HELP_MAX_DEPTH
+                    )
+                
+                exchange_wallet_threshold = st.number_input(
+                    "Exchange Wallet Threshold",
+                    min_value=100,
+                    max_value=100000,
+                    value=current_exchange_threshold,
+                    key="settings_exchange_threshold",
+                    help=HELP_EXCHANGE_THRESHOLD
                 )
             
-            with col2:
-                max_depth = st.number_input(
-                    "Max Tracing Depth",
-                    min_value=1,
-                    max_value=50,
-                    value=current_max_depth,
-                    key="settings_max_depth",
-                    help="Maximum depth for tracing connections. Stops tracing after this many hops from the starting addresses. Suggested: 10 (allows multi-hop tracing while preventing infinite loops)."
-                )
+            # Address Filtering Limits
+            with st.expander("Address Filtering Limits", expanded=False):
+                st.markdown("""
+                **Purpose:** Prevent queue flooding from transactions with many inputs or outputs.
+                These limits cap how many addresses are processed per transaction.
+                """)
+                
+                st.info(TIP_ADDRESS_LIMITS)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    max_input_addresses_per_tx = st.number_input(
+                        "Max Input Addresses Per Transaction",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_max_input_addrs,
+                        key="settings_max_input_addrs",
+                        help=HELP_MAX_INPUT_ADDRS
+                    )
+                
+                with col2:
+                    max_output_addresses_per_tx = st.number_input(
+                        "Max Output Addresses Per Transaction",
+                        min_value=1,
+                        max_value=1000,
+                        value=current_max_output_addrs,
+                        key="settings_max_output_addrs",
+                        help=HELP_MAX_OUTPUT_ADDRS
+                    )
             
-            exchange_wallet_threshold = st.number_input(
-                "Exchange Wallet Threshold",
-                min_value=100,
-                max_value=100000,
-                value=current_exchange_threshold,
-                key="settings_exchange_threshold",
-                help="Addresses with more than this many transactions are considered exchange wallets and are skipped entirely. Exchange wallets have too many transactions to be useful for tracing. Suggested: 1000 (identifies high-volume addresses like exchanges)."
-            )
-        
-        # Address Filtering Limits
-        with st.expander("Address Filtering Limits", expanded=False):
-            st.markdown("""
-            **Purpose:** Prevent queue flooding from transactions with many inputs or outputs.
-            These limits cap how many addresses are processed per transaction.
-            """)
+            st.divider()
             
-            st.info("💡 **Suggested Values:** Max Input: 50, Max Output: 50 | These limits prevent queue flooding from large transactions while still processing a reasonable number of addresses. Transactions with 50+ inputs/outputs are already filtered by the skip mixer thresholds, so this acts as a safety net for edge cases. The value of 50 matches the skip mixer threshold to maintain consistency.")
+            # Save button (disabled while the connectivity warning is displayed or a save is in flight)
+            col1, col2 = st.columns([1, 3])
             
-            col1, col2 = st.columns(2)
             with col1:
-                max_input_addresses_per_tx = st.number_input(
-                    "Max Input Addresses Per Transaction",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_max_input_addrs,
-                    key="settings_max_input_addrs",
-                    help="Maximum input addresses to process per transaction. If a transaction has more inputs, only the first N are processed (prevents queue flooding). Suggested: 50 (matches skip mixer threshold, prevents queue flooding)."
+                submitted = st.form_submit_button(
+                    "Save Settings",
+                    width='stretch',
+                    type="primary",
+                    disabled=bool(
+                        (st.session_state.show_connectivity_warning and st.session_state.pending_electrumx_settings)
+                        or st.session_state.save_future is not None
+                    )
                 )
             
             with col2:
-                max_output_addresses_per_tx = st.number_input(
-                    "Max Output Addresses Per Transaction",
-                    min_value=1,
-                    max_value=1000,
-                    value=current_max_output_addrs,
-                    key="settings_max_output_addrs",
-                    help="Maximum output addresses to process per transaction. If a transaction has more outputs, only the first N are processed (prevents queue flooding). Suggested: 50 (matches skip mixer threshold, prevents queue flooding)."
-                )
-        
-        st.divider()
+                st.caption("Settings are saved to the .env file and persist across restarts")
         
         # Show success message if settings were just saved
         if st.session_state.settings_save_success:
             st.success("Settings saved successfully!")
             st.session_state.settings_save_success = False
+        if st.session_state.settings_save_error:
+            st.error(st.session_state.settings_save_error)
+            st.session_state.settings_save_error = None
         
         # Handle connectivity warning dialog
         if st.session_state.show_connectivity_warning and st.session_state.pending_electrumx_settings:
-            st.error("⚠️ **ElectrumX Server Connectivity Warning**")
-            pending = st.session_state.pending_electrumx_settings
-            error_msg = pending.get('error_message', 'Unknown error')
+            connectivity_warning_dialog()
+        
+        # Diff against current settings and save (only on form submit)
+        if submitted:
+            # Prepare update payload: only fields that differ from the current settings
+            changes = {}
+            if selected_provider != current_provider:
+                changes['default_api'] = selected_provider
             
-            st.warning(f"""
-**Server is not reachable:**
-- Host: `{pending.get('host', 'N/A')}`
-- Port: `{pending.get('port', 'N/A')}`
-- Error: {error_msg}
-
-You can still save these settings, but the server may not be accessible when using ElectrumX provider.
-            """)
+            # Handle API key (only if Mempool is selected)
+            if selected_provider == 'mempool':
+                if clear_key:
+                    changes['mempool_api_key'] = ""  # Clear the key
+                elif mempool_api_key:
+                    changes['mempool_api_key'] = mempool_api_key  # Set new key
             
-            col_warn1, col_warn2 = st.columns(2)
-            with col_warn1:
-                if st.button("Save Anyway", key="save_anyway", width='stretch', type="secondary"):
-                    # Clear warning state first
-                    st.session_state.show_connectivity_warning = False
-                    # Proceed with save using pending settings
-                    pending = st.session_state.pending_electrumx_settings
-                    result = save_settings(
-                        default_api=pending.get('default_api'),
-                        mempool_api_key=pending.get('mempool_api_key'),
-                        electrumx_host=pending.get('electrumx_host'),
-                        electrumx_port=pending.get('electrumx_port'),
-                        electrumx_use_ssl=pending.get('electrumx_use_ssl'),
-                        electrumx_cert=pending.get('electrumx_cert'),
-                        use_cache=pending.get('use_cache'),
-                        mixer_input_threshold=pending.get('mixer_input_threshold'),
-                        mixer_output_threshold=pending.get('mixer_output_threshold'),
-                        suspicious_ratio_threshold=pending.get('suspicious_ratio_threshold'),
-                        skip_mixer_input_threshold=pending.get('skip_mixer_input_threshold'),
-                        skip_mixer_output_threshold=pending.get('skip_mixer_output_threshold'),
-                        skip_distribution_max_inputs=pending.get('skip_distribution_max_inputs'),
-                        skip_distribution_min_outputs=pending.get('skip_distribution_min_outputs'),
-                        max_transactions_per_address=pending.get('max_transactions_per_address'),
-                        max_depth=pending.get('max_depth'),
-                        exchange_wallet_threshold=pending.get('exchange_wallet_threshold'),
-                        max_input_addresses_per_tx=pending.get('max_input_addresses_per_tx'),
-                        max_output_addresses_per_tx=pending.get('max_output_addresses_per_tx')
-                    )
-                    st.session_state.pending_electrumx_settings = None
-                    # Clear test connection result to avoid duplicates
-                    st.session_state.test_connection_result = None
-                    if result:
-                        st.session_state.settings_save_success = True
-                        st.rerun()
-            with col_warn2:
-                if st.button("Cancel", key="cancel_save", width='stretch', type="primary"):
-                    # Clear warning state and pending settings
-                    st.session_state.show_connectivity_warning = False
-                    st.session_state.pending_electrumx_settings = None
-                    st.rerun()
+            # Handle ElectrumX settings (only if ElectrumX is selected)
+            if selected_provider == 'electrumx':
+                # Check if values changed from current settings
+                if electrumx_host and electrumx_host != current_host:
+                    changes['electrumx_host'] = electrumx_host
+                if electrumx_port and str(electrumx_port) != stored_port:
+                    changes['electrumx_port'] = electrumx_port
+                form_use_ssl = 'true' if electrumx_use_ssl else 'false'
+                if form_use_ssl != stored_use_ssl:
+                    changes['electrumx_use_ssl'] = form_use_ssl
+                # Allow empty cert to clear it
+                if electrumx_cert != current_cert:
+                    changes['electrumx_cert'] = electrumx_cert
             
-            st.divider()
-        
-        # Save button (only show if warning is not displayed)
-        if not (st.session_state.show_connectivity_warning and st.session_state.pending_electrumx_settings):
-            col1, col2 = st.columns([1, 3])
+            # Handle cache and threshold settings: (settings key, form value, current value)
+            fields = (
+                ('use_cache', use_cache, current_use_cache),
+                ('mixer_input_threshold', mixer_input_threshold, current_mixer_input),
+                ('mixer_output_threshold', mixer_output_threshold, current_mixer_output),
+                ('suspicious_ratio_threshold', suspicious_ratio_threshold, current_suspicious_ratio),
+                ('skip_mixer_input_threshold', skip_mixer_input_threshold, current_skip_mixer_input),
+                ('skip_mixer_output_threshold', skip_mixer_output_threshold, current_skip_mixer_output),
+                ('skip_distribution_max_inputs', skip_distribution_max_inputs, current_skip_dist_max_inputs),
+                ('skip_distribution_min_outputs', skip_distribution_min_outputs, current_skip_dist_min_outputs),
+                ('max_transactions_per_address', max_transactions_per_address, current_max_tx_per_addr),
+                ('max_depth', max_depth, current_max_depth),
+                ('exchange_wallet_threshold', exchange_wallet_threshold, current_exchange_threshold),
+                ('max_input_addresses_per_tx', max_input_addresses_per_tx, current_max_input_addrs),
+                ('max_output_addresses_per_tx', max_output_addresses_per_tx, current_max_output_addrs)
+            )
+            changes.update({key: value for key, value, current in fields if value != current})
             
-            with col1:
-                if st.button("Save Settings", width='stretch', type="primary"):
-                    # Prepare update payload
-                    update_provider = selected_provider if selected_provider != current_provider else None
-                    
-                    # Handle API key (only if Mempool is selected)
-                    update_key = None
-                    if selected_provider == 'mempool':
-                        if clear_key:
-                            update_key = ""  # Clear the key
-                        elif mempool_api_key:
-                            update_key = mempool_api_key  # Set new key
-                    
-                    # Handle ElectrumX settings (only if ElectrumX is selected)
-                    update_electrumx_host = None
-                    update_electrumx_port = None
-                    update_electrumx_use_ssl = None
-                    update_electrumx_cert = None
-                    
-                    if selected_provider == 'electrumx':
-                        # Check if values changed from current settings
-                        current_host = current_settings.get('electrumx_host', '')
-                        current_port = current_settings.get('electrumx_port', '50001')
-                        current_use_ssl = current_settings.get('electrumx_use_ssl', 'false').lower() == 'true'
-                        current_cert = current_settings.get('electrumx_cert', '')
-                        
-                        if electrumx_host and electrumx_host != current_host:
-                            update_electrumx_host = electrumx_host
-                        if electrumx_port and str(electrumx_port) != str(current_port):
-                            update_electrumx_port = electrumx_port
-                        if electrumx_use_ssl != current_use_ssl:
-                            update_electrumx_use_ssl = 'true' if electrumx_use_ssl else 'false'
-                        # Allow empty cert to clear it
-                        if electrumx_cert != current_cert:
-                            update_electrumx_cert = electrumx_cert
-                    
-                    # Handle cache setting
-                    update_use_cache = None
-                    if use_cache != current_use_cache:
-                        update_use_cache = use_cache
-                    
-                    # Handle threshold settings
-                    update_mixer_input = None
-                    update_mixer_output = None
-                    update_suspicious_ratio = None
-                    update_skip_mixer_input = None
-                    update_skip_mixer_output = None
-                    update_skip_dist_max_inputs = None
-                    update_skip_dist_min_outputs = None
-                    update_max_tx_per_addr = None
-                    update_max_depth = None
-                    update_exchange_threshold = None
-                    update_max_input_addrs = None
-                    update_max_output_addrs = None
-                    
-                    if mixer_input_threshold != current_mixer_input:
-                        update_mixer_input = mixer_input_threshold
-                    if mixer_output_threshold != current_mixer_output:
-                        update_mixer_output = mixer_output_threshold
-                    if suspicious_ratio_threshold != current_suspicious_ratio:
-                        update_suspicious_ratio = suspicious_ratio_threshold
-                    if skip_mixer_input_threshold != current_skip_mixer_input:
-                        update_skip_mixer_input = skip_mixer_input_threshold
-                    if skip_mixer_output_threshold != current_skip_mixer_output:
-                        update_skip_mixer_output = skip_mixer_output_threshold
-                    if skip_distribution_max_inputs != current_skip_dist_max_inputs:
-                        update_skip_dist_max_inputs = skip_distribution_max_inputs
-                    if skip_distribution_min_outputs != current_skip_dist_min_outputs:
-                        update_skip_dist_min_outputs = skip_distribution_min_outputs
-                    if max_transactions_per_address != current_max_tx_per_addr:
-                        update_max_tx_per_addr = max_transactions_per_address
-                    if max_depth != current_max_depth:
-                        update_max_depth = max_depth
-                    if exchange_wallet_threshold != current_exchange_threshold:
-                        update_exchange_threshold = exchange_wallet_threshold
-                    if max_input_addresses_per_tx != current_max_input_addrs:
-                        update_max_input_addrs = max_input_addresses_per_tx
-                    if max_output_addresses_per_tx != current_max_output_addrs:
-                        update_max_output_addrs = max_output_addresses_per_tx
+            # Only save if something changed
+            if changes:
+                # Test connectivity if ElectrumX settings are being updated or provider is being switched to ElectrumX
+                # (electrumx_* keys only enter changes while ElectrumX is selected, so no provider check is needed)
+                connectivity_test_failed = False
+                should_test_connectivity = (
+                    'electrumx_host' in changes or 'electrumx_port' in changes or changes.get('default_api') == 'electrumx'
+                )
+                
+                if should_test_connectivity:
+                    # Changed values always come from the form, so test the form values directly
+                    # (electrumx_use_ssl is already a bool; no 'true'/'false' round-trip)
+                    test_host = electrumx_host
+                    test_port = electrumx_port
+                    test_ssl = electrumx_use_ssl
+                    test_cert = electrumx_cert
                     
-                    # Only save if something changed
-                    if (update_provider is not None or update_key is not None or 
-                        update_electrumx_host is not None or update_electrumx_port is not None or
-                        update_electrumx_use_ssl is not None or update_electrumx_cert is not None or
-                        update_use_cache is not None or
-                        update_mixer_input is not None or update_mixer_output is not None or
-                        update_suspicious_ratio is not None or update_skip_mixer_input is not None or
-                        update_skip_mixer_output is not None or update_skip_dist_max_inputs is not None or
-                        update_skip_dist_min_outputs is not None or update_max_tx_per_addr is not None or
-                        update_max_depth is not None or update_exchange_threshold is not None or
-                        update_max_input_addrs is not None or update_max_output_addrs is not None):
-                        
-                        # Test connectivity if ElectrumX settings are being updated or provider is being switched to ElectrumX
-                        connectivity_test_failed = False
-                        should_test_connectivity = (
-                            selected_provider == 'electrumx' and 
-                            (update_electrumx_host is not None or update_electrumx_port is not None or update_provider == 'electrumx')
-                        )
-                        
-                        if should_test_connectivity:
-                            # Use the new values if provided, otherwise use form values
-                            test_host = update_electrumx_host if update_electrumx_host is not None else electrumx_host
-                            test_port = update_electrumx_port if update_electrumx_port is not None else electrumx_port
-                            test_ssl = update_electrumx_use_ssl == 'true' if update_electrumx_use_ssl is not None else electrumx_use_ssl
-                            test_cert = update_electrumx_cert if update_electrumx_cert is not None else electrumx_cert
-                            
-                            if test_host and test_port:
-                                with st.spinner("Testing server connectivity..."):
-                                    success, error_message = test_electrumx_connectivity(
-                                        test_host, 
-                                        test_port, 
-                                        test_ssl,
-                                        test_cert if test_cert else None,
-                                        timeout=5
-                                    )
-                                
-                                if not success:
-                                    # Store pending settings and show warning
-                                    st.session_state.pending_electrumx_settings = {
-                                        'default_api': update_provider,
-                                        'mempool_api_key': update_key,
-                                        'electrumx_host': update_electrumx_host,
-                                        'electrumx_port': update_electrumx_port,
-                                        'electrumx_use_ssl': update_electrumx_use_ssl,
-                                        'electrumx_cert': update_electrumx_cert,
-                                        'use_cache': update_use_cache,
-                                        'mixer_input_threshold': update_mixer_input,
-                                        'mixer_output_threshold': update_mixer_output,
-                                        'suspicious_ratio_threshold': update_suspicious_ratio,
-                                        'skip_mixer_input_threshold': update_skip_mixer_input,
-                                        'skip_mixer_output_threshold': update_skip_mixer_output,
-                                        'skip_distribution_max_inputs': update_skip_dist_max_inputs,
-                                        'skip_distribution_min_outputs': update_skip_dist_min_outputs,
-                                        'max_transactions_per_address': update_max_tx_per_addr,
-                                        'max_depth': update_max_depth,
-                                        'exchange_wallet_threshold': update_exchange_threshold,
-                                        'max_input_addresses_per_tx': update_max_input_addrs,
-                                        'max_output_addresses_per_tx': update_max_output_addrs,
-                                        'host': test_host,
-                                        'port': test_port,
-                                        'error_message': error_message
-                                    }
-                                    st.session_state.show_connectivity_warning = True
-                                    connectivity_test_failed = True
-                                    st.rerun()
+                    if test_host and test_port:
+                        with st.spinner("Testing server connectivity..."):
+                            success, error_message = test_electrumx_connectivity_cached(
+                                test_host, 
+                                test_port, 
+                                test_ssl,
+                                test_cert if test_cert else None,
+                                timeout=5
+                            )
                         
-                        # Connectivity test passed or not needed, proceed with save
-                        if not connectivity_test_failed:
-                            with st.spinner("Saving settings..."):
-                                result = save_settings(
-                                    default_api=update_provider,
-                                    mempool_api_key=update_key,
-                                    electrumx_host=update_electrumx_host,
-                                    electrumx_port=update_electrumx_port,
-                                    electrumx_use_ssl=update_electrumx_use_ssl,
-                                    electrumx_cert=update_electrumx_cert,
-                                    use_cache=update_use_cache,
-                                    mixer_input_threshold=update_mixer_input,
-                                    mixer_output_threshold=update_mixer_output,
-                                    suspicious_ratio_threshold=update_suspicious_ratio,
-                                    skip_mixer_input_threshold=update_skip_mixer_input,
-                                    skip_mixer_output_threshold=update_skip_mixer_output,
-                                    skip_distribution_max_inputs=update_skip_dist_max_inputs,
-                                    skip_distribution_min_outputs=update_skip_dist_min_outputs,
-                                    max_transactions_per_address=update_max_tx_per_addr,
-                                    max_depth=update_max_depth,
-                                    exchange_wallet_threshold=update_exchange_threshold,
-                                    max_input_addresses_per_tx=update_max_input_addrs,
-                                    max_output_addresses_per_tx=update_max_output_addrs
-                                )
-                                
-                                if result:
-                                    # Clear test connection result to avoid duplicates
-                                    st.session_state.test_connection_result = None
-                                    st.session_state.settings_save_success = True
-                                    st.rerun()
-                    else:
-                        st.info("No changes to save")
-            
-            with col2:
-                st.caption("Settings are saved to the .env file and persist across restarts")
+                        if not success:
+                            # Store pending settings and show warning in one write, then rerun once
+                            st.session_state.update({
+                                'pending_electrumx_settings': {
+                                    'changes': changes,
+                                    'host': test_host,
+                                    'port': test_port,
+                                    'error_message': error_message
+                                },
+                                'show_connectivity_warning': True
+                            })
+                            connectivity_test_failed = True
+                            st.rerun()
+                
+                # Connectivity test passed or not needed, save on a worker thread;
+                # settings_save_status() reports the outcome on the next run
+                if not connectivity_test_failed:
+                    save_settings_in_background(**changes)
+                    st.rerun()
+            else:
+                st.info("No changes to save")
         
         st.divider()
         
@@ -2028,7 +2139,7 @@ You can still save these settings, but the server may not be accessible when usi
             if current_settings.get('electrumx_port'):
                 electrumx_config['port'] = current_settings.get('electrumx_port')
             if current_settings.get('electrumx_use_ssl'):
-                electrumx_config['use_ssl'] = current_settings.get('electrumx_use_ssl').lower() == 'true'
+                electrumx_config['use_ssl'] = current_settings.get('electrumx_use_ssl')
             if current_settings.get('electrumx_cert'):
                 electrumx_config['cert'] = current_settings.get('electrumx_cert')
             
@@ -2039,6 +2150,12 @@ You can still save these settings, but the server may not be accessible when usi
         
         st.divider()
         
+        # Sessions protect their exports/checkpoints from cleanup, so the cached cleanup scans
+        # are keyed on the session set (ids and status) as well as the directory mtime
+        cleanup_sessions = get_sessions()
+        active_session_ids = {s['session_id'] for s in cleanup_sessions}
+        sessions_fingerprint = hash(frozenset((s['session_id'], s.get('status')) for s in cleanup_sessions))
+        
         # Export File Management
         st.subheader("Export File Management")
         st.markdown("Delete export files that have no connections and are not part of active sessions")
@@ -2049,69 +2166,50 @@ You can still save these settings, but the server may not be accessible when usi
             if not export_dir.exists():
                 return []
             
-            # Get active session IDs
-            sessions = get_sessions()
-            active_session_ids = [s['session_id'] for s in sessions]
             files_to_delete = []
             
-            json_files = list(export_dir.glob("connections_*.json"))
-            for json_file in json_files:
-                # Parse session_id from filename
-                filename = json_file.stem
-                parts = filename.split('_', 2)
-                if len(parts) >= 3 and parts[0] == 'connections':
-                    session_id = parts[1]
-                    
-                    # Check if session is active
-                    if session_id in active_session_ids:
-                        continue
-                    
-                    # Check if file has connections
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            connections = data.get('connections_found', [])
-                            if len(connections) == 0:
-                                # Find corresponding CSV file
-                                csv_file = export_dir / f"{filename}.csv"
-                                files_to_delete.append({
-                                    'session_id': session_id,
-                                    'json_path': str(json_file),
-                                    'csv_path': str(csv_file) if csv_file.exists() else None,
-                                    'filename': json_file.name
-                                })
-                    except Exception:
-                        # If we can't read the file, skip it
-                        continue
+            for json_file in export_dir.glob("connections_*.json"):
+                # Parse session_id from filename (connections_<session_id>_<timestamp>.json)
+                match = EXPORT_NAME_RE.match(json_file.name)
+                if not match:
+                    continue
+                session_id = match.group(1)
+                
+                # Check if session is active
+                if session_id in active_session_ids:
+                    continue
+                
+                # Check if file has connections
+                try:
+                    if not export_has_connections(json_file):
+                        # Find corresponding CSV file
+                        csv_file = json_file.with_suffix('.csv')
+                        files_to_delete.append({
+                            'session_id': session_id,
+                            'json_path': str(json_file),
+                            'csv_path': str(csv_file) if csv_file.exists() else None,
+                            'filename': json_file.name
+                        })
+                except Exception:
+                    # If we can't read the file, skip it
+                    continue
             
             return files_to_delete
         
         def delete_export_files(file_paths):
-            """Delete specified export files"""
-            deleted = []
-            errors = []
-            
-            for file_info in file_paths:
-                try:
-                    # Delete JSON file
-                    json_path = Path(file_info['json_path'])
-                    if json_path.exists():
-                        json_path.unlink()
-                        deleted.append(file_info['json_path'])
-                    
-                    # Delete CSV file if it exists
-                    if file_info['csv_path']:
-                        csv_path = Path(file_info['csv_path'])
-                        if csv_path.exists():
-                            csv_path.unlink()
-                            deleted.append(file_info['csv_path'])
-                except Exception as e:
-                    errors.append(f"Error deleting {file_info['filename']}: {e}")
-            
-            return deleted, errors
+            """Delete specified export files (JSON and CSV) via the API in one request"""
+            paths = [f['json_path'] for f in file_paths] + [f['csv_path'] for f in file_paths if f['csv_path']]
+            try:
+                response = api_session.post(f"{API_URL}/exports/cleanup", json={'paths': paths}, timeout=API_TIMEOUT)
+                if response.status_code == 200:
+                    result = response.json()
+                    return result.get('deleted', []), result.get('errors', [])
+                return [], [f"API error: {response.status_code}"]
+            except Exception as e:
+                return [], [f"Error: {e}"]
         
         # Get files eligible for deletion
-        files_to_delete = get_export_files_to_delete()
+        files_to_delete = get_cached_scan('export_cleanup_cache', (get_dir_mtime(EXPORT_DIR), sessions_fingerprint), get_export_files_to_delete)
         
         if files_to_delete:
             st.info(f"Found {len(files_to_delete)} export file(s) eligible for deletion")
@@ -2122,8 +2220,7 @@ You can still save these settings, but the server may not be accessible when usi
                     st.write(f"- `{file_info['filename']}` (Session: {file_info['session_id'][:12]}...)")
             
             # Delete button with confirmation
-            if 'confirm_delete_exports' not in st.session_state:
-                st.session_state.confirm_delete_exports = False
+            st.session_state.setdefault('confirm_delete_exports', False)
             
             if not st.session_state.confirm_delete_exports:
                 if st.button("Delete Empty Export Files", width='stretch', type="secondary"):
@@ -2143,14 +2240,16 @@ You can still save these settings, but the server may not be accessible when usi
                 with col1:
                     if st.button("Confirm Delete", width='stretch', type="primary"):
                         deleted, errors = delete_export_files(files_to_delete)
-                        if errors:
-                            for error in errors:
-                                st.error(error)
+                        st.session_state.pop('export_cleanup_cache', None)
                         if deleted:
-                            st.success(f"✅ Deleted {len(deleted)} file(s)")
+                            # Toasts survive the rerun, so no need to pause before it
+                            st.toast(f"✅ Deleted {len(deleted)} file(s)")
+                            for error in errors:
+                                st.toast(f"❌ {error}")
                             st.session_state.confirm_delete_exports = False
-                            time.sleep(1)
                             st.rerun()
+                        for error in errors:
+                            st.error(error)
                 with col2:
                     if st.button("Cancel", width='stretch', type="secondary"):
                         st.session_state.confirm_delete_exports = False
@@ -2168,44 +2267,19 @@ You can still save these settings, but the server may not be accessible when usi
         def get_checkpoints_to_delete():
             """Get list of checkpoints that can be deleted (all but most recent for each session)"""
             try:
-                # Get all checkpoints
-                checkpoints = get_checkpoints()
-                if not checkpoints:
-                    return []
-                
-                # Group checkpoints by session_id
-                checkpoints_by_session = {}
-                for cp in checkpoints:
-                    session_id = cp['session_id']
-                    if session_id not in checkpoints_by_session:
-                        checkpoints_by_session[session_id] = []
-                    checkpoints_by_session[session_id].append(cp)
-                
-                # For each session, keep only the most recent (first in sorted list)
-                # and mark the rest for deletion
-                checkpoints_to_delete = []
-                for session_id, session_checkpoints in checkpoints_by_session.items():
-                    # Sort by timestamp, most recent first
-                    session_checkpoints.sort(key=lambda x: x['timestamp'], reverse=True)
-                    
-                    # Keep the first one (most recent), mark the rest for deletion
-                    if len(session_checkpoints) > 1:
-                        for checkpoint in session_checkpoints[1:]:
-                            checkpoints_to_delete.append({
-                                'session_id': checkpoint['session_id'],
-                                'checkpoint_id': checkpoint['checkpoint_id'],
-                                'timestamp': checkpoint['timestamp']
-                            })
-                
-                return checkpoints_to_delete
+                # The server groups and sorts checkpoints; the preview endpoint is read-only
+                response = api_session.get(f"{API_URL}/checkpoints/cleanup/preview", timeout=API_TIMEOUT)
+                if response.status_code == 200:
+                    return response.json().get('checkpoints', [])
+                st.error(f"Error getting checkpoints: API error {response.status_code}")
             except Exception as e:
                 st.error(f"Error getting checkpoints: {e}")
-                return []
+            return []
         
         def cleanup_old_checkpoints():
             """Call API to cleanup old checkpoints"""
             try:
-                response = requests.post(f"{API_URL}/checkpoints/cleanup", timeout=API_TIMEOUT)
+                response = api_session.post(f"{API_URL}/checkpoints/cleanup", timeout=API_TIMEOUT)
                 if response.status_code == 200:
                     return response.json()
                 else:
@@ -2214,7 +2288,7 @@ You can still save these settings, but the server may not be accessible when usi
                 return {'deleted_count': 0, 'errors': [f"Error: {e}"]}
         
         # Get checkpoints eligible for deletion
-        checkpoints_to_delete = get_checkpoints_to_delete()
+        checkpoints_to_delete = get_cached_scan('checkpoint_cleanup_cache', (get_dir_mtime(CHECKPOINT_DIR), sessions_fingerprint), get_checkpoints_to_delete)
         
         if checkpoints_to_delete:
             st.info(f"Found {len(checkpoints_to_delete)} checkpoint(s) eligible for deletion")
@@ -2225,8 +2299,7 @@ You can still save these settings, but the server may not be accessible when usi
                     st.write(f"- Session: `{cp_info['session_id'][:12]}...` | Checkpoint: `{cp_info['checkpoint_id'][:12]}...` | Timestamp: {cp_info['timestamp']}")
             
             # Delete button with confirmation
-            if 'confirm_delete_checkpoints' not in st.session_state:
-                st.session_state.confirm_delete_checkpoints = False
+            st.session_state.setdefault('confirm_delete_checkpoints', False)
             
             if not st.session_state.confirm_delete_checkpoints:
                 if st.button("Delete Old Checkpoints", width='stretch', type="secondary"):
@@ -2243,14 +2316,16 @@ You can still save these settings, but the server may not be accessible when usi
                 with col1:
                     if st.button("Confirm Delete", width='stretch', type="primary"):
                         result = cleanup_old_checkpoints()
-                        if result.get('errors'):
-                            for error in result['errors']:
-                                st.error(error)
+                        st.session_state.pop('checkpoint_cleanup_cache', None)
                         if result.get('deleted_count', 0) > 0:
-                            st.success(f"✅ Deleted {result['deleted_count']} checkpoint(s)")
+                            # Toasts survive the rerun, so no need to pause before it
+                            st.toast(f"✅ Deleted {result['deleted_count']} checkpoint(s)")
+                            for error in result.get('errors', []):
+                                st.toast(f"❌ {error}")
                             st.session_state.confirm_delete_checkpoints = False
-                            time.sleep(1)
                             st.rerun()
+                        for error in result.get('errors', []):
+                            st.error(error)
                 with col2:
                     if st.button("Cancel", width='stretch', type="secondary"):
                         st.session_state.confirm_delete_checkpoints = False
@@ -2263,16 +2338,15 @@ You can still save these settings, but the server may not be accessible when usi
         if st.button("Retry", width='stretch'):
             st.rerun()
 
-# Footer
+# Footer (the "Updated" time is only meaningful while auto-refresh is on)
 st.divider()
-st.markdown(f"""
-<div style='text-align: center; color: gray; font-size: 12px;'>
-    <p>Bitcoin Address Linker | Streamlit UI</p>
-    <p>Updated: {datetime.now().strftime('%H:%M:%S')}</p>
-</div>
-""", unsafe_allow_html=True)
+footer_updated = f"<p>Updated: {datetime.now():%H:%M:%S}</p>" if st.session_state.auto_refresh_enabled else ""
+st.markdown(FOOTER_HTML.format(updated=footer_updated), unsafe_allow_html=True)
 
-# Auto-refresh
+# Auto-refresh (the component schedules the rerun in the browser instead of blocking the script thread)
 if st.session_state.auto_refresh_enabled:
-    time.sleep(60)
-    st.rerun()
\ No newline at end of file
+    if st_autorefresh:
+        st_autorefresh(interval=60_000, key="auto_refresh")
+    else:
+        time.sleep(60)
+        st.rerun()
@@ -2,6 +2,7 @@ import requests
 import json
 
 address = "1J6NL5rPnQMdt8hqoV6gmefsYgcXjVxdrr"
+target = "bc1qvyel6c8tp34na7fw446evjugxl5zz66cm9ukku"
 
 # Test Mempool directly
 url = f"https://mempool.space/api/address/{address}/txs"
@@ -18,17 +19,15 @@ try:
         
         if txs:
             print("Sample transaction:")
-            print(json.dumps(txs[0], indent=2)[:500])
+            print(json.dumps(txs[0])[:500])
             
-            # Check if outputs contain 1J6NL5rPnQMdt8hqoV6gmefsYgcXjVxdrr
+            # Check if outputs pay the target address
             for tx in txs[:10]:
                 outputs = tx.get('vout', [])  # ← Note: might be 'vout' not 'outputs'
                 for output in outputs:
-                    if 'scriptpubkey_address' in output:
-                        addr = output['scriptpubkey_address']
-                        if 'bc1qvyel6c8tp34na7fw446evjugxl5zz66cm9ukku' in str(addr):
-                            print(f"\n✅ Found target in transaction!")
-                            print(json.dumps(tx, indent=2))
+                    if output.get('scriptpubkey_address') == target:
+                        print(f"\n✅ Found target in transaction {tx.get('txid')}!")
+                        print(json.dumps(output, indent=2))
     else:
         print(f"Error: {response.text}")
         
@@ -4,92 +4,156 @@ Test connectivity to the host PC and ElectrumX server
 Verifies network connectivity and ElectrumX server accessibility
 """
 import socket
+import selectors
+import errno
 import json
 import sys
+import functools
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+# Optional: faster JSON parsing (orjson and json both accept raw bytes)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 from config import (
     ELECTRUMX_HOST, ELECTRUMX_PORT, ELECTRUMX_USE_SSL,
     SSH_HOST, SSH_USER, SSH_KEY_PATH, SSH_PORT, ELECTRUMX_DOCKER_CONTAINER
 )
 
-def test_host_reachability(host, port, timeout=5):
-    """Test if we can reach a host on a specific port"""
+# Small address with few transactions (the genesis address has 54k+ transactions, which takes too long)
+TEST_ADDRESS = "38YEkk8pKA1DXWhQTdW53ibXUaFDYqk269"
+# Known transaction for the direct blockchain.transaction.get check
+KNOWN_TX = "065f3cf51e45fff9063ebc50deb2af5e24b1817020e4de19a782eafee90f5b4e"
+
+# Raw-socket server.version probe, serialized once
+SERVER_VERSION_REQUEST_ID = 1
+SERVER_VERSION_REQUEST = (json.dumps({
+    "jsonrpc": "2.0",
+    "method": "server.version",
+    "params": ["LinkFinder-Test", "1.4"],
+    "id": SERVER_VERSION_REQUEST_ID
+}) + "\n").encode()
+
+# Response schemas, built once (ordered tuples keep error messages deterministic)
+JSONRPC_REQUIRED_FIELDS = ("jsonrpc", "id")
+JSONRPC_PAYLOAD_KEYS = frozenset(("result", "error"))
+TX_REQUIRED_FIELDS = ("txid", "hash", "status", "vin", "vout")
+TX_REQUIRED_KEYS = frozenset(TX_REQUIRED_FIELDS)
+
+# connect_ex() results meaning "connection in progress" on a non-blocking socket
+CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, getattr(errno, 'WSAEWOULDBLOCK', 10035)}
+
+@functools.lru_cache(maxsize=None)
+def resolve_host(host):
+    """
+    Resolve host once per run (MagicDNS lookups aren't free)
+    
+    Returns:
+        Tuple of (family, sockaddr) for every address getaddrinfo returned, in its order.
+        Each sockaddr is kept whole (IPv6 flowinfo and scope_id included).
+    """
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    return tuple((family, sockaddr) for family, _, _, _, sockaddr in infos)
+
+def probe_ports(host, ports, timeout=5):
+    """
+    Test reachability of several ports on one host with a single selector
+    
+    All connects are started non-blocking and share one timeout budget, so an
+    unreachable host costs one timeout instead of one per port. Like
+    create_connection, a port whose connect fails on one resolved address is
+    retried on the next (e.g. IPv4 after a broken IPv6 route).
+    
+    Returns:
+        Dict of port -> reachable (bool)
+    """
+    results = dict.fromkeys(ports, False)
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        return result == 0
-    except Exception as e:
-        return False
+        addresses = resolve_host(host)
+    except OSError:
+        return results
+    
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as selector:
+        def start_connect(port, index):
+            """Start a connect to port on addresses[index], moving on while connects fail outright"""
+            for family, sockaddr in addresses[index:]:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                error = sock.connect_ex((sockaddr[0], port, *sockaddr[2:]))
+                if error in CONNECT_IN_PROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE, (port, index))
+                    return
+                sock.close()
+                if error == 0:
+                    results[port] = True
+                    return
+                index += 1
+        
+        for port in results:
+            start_connect(port, 0)
+        
+        # A socket becomes writable once its connect finishes; SO_ERROR says whether it succeeded
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                port, index = key.data
+                connected = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+                if connected:
+                    results[port] = True
+                else:
+                    start_connect(port, index + 1)
+        
+        # Anything still pending timed out
+        for key in list(selector.get_map().values()):
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+    
+    return results
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context():
+    """Build the SSL context once and reuse it (loading the CA bundle is costly)"""
+    import ssl
+    context = ssl.create_default_context()
+    # For self-signed certificates, disable verification
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
 
 def test_electrumx_connection(host, port, use_ssl=False, timeout=5):
     """Test ElectrumX server connection and protocol"""
     try:
+        # create_connection tries every A/AAAA address in turn
+        sock = socket.create_connection((host, port), timeout=timeout)
+        # Send the small request immediately instead of letting Nagle hold it for an ACK
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         if use_ssl:
-            import ssl
-            context = ssl.create_default_context()
-            # For self-signed certificates, disable verification
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((host, port))
-            sock = context.wrap_socket(sock, server_hostname=host)
-        else:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((host, port))
+            sock = get_ssl_context().wrap_socket(sock, server_hostname=host)
         
         # Send a simple Electrum protocol request
-        request = {
-            "jsonrpc": "2.0",
-            "method": "server.version",
-            "params": ["LinkFinder-Test", "1.4"],
-            "id": 1
-        }
-        request_str = json.dumps(request) + "\n"
-        sock.sendall(request_str.encode())
-        
-        # Read response - Electrum protocol uses newline-delimited JSON
-        # Read until we get a complete line (JSON object)
-        response_data = b""
-        buffer = b""
-        start_time = time.time()
-        read_timeout = 10  # Total timeout for reading
+        sock.sendall(SERVER_VERSION_REQUEST)
         
-        while (time.time() - start_time) < read_timeout:
+        # Read response - Electrum protocol uses newline-delimited JSON, so a buffered
+        # readline() returns exactly one complete message
+        sock.settimeout(10)  # Read timeout
+        with sock.makefile('rb', buffering=65536) as f:
             try:
-                sock.settimeout(2)  # Short timeout for each recv
-                chunk = sock.recv(4096)
-                if not chunk:
-                    # Connection closed
-                    break
-                
-                buffer += chunk
-                
-                # Check if we have a complete line (newline-delimited JSON)
-                if b'\n' in buffer:
-                    # Split by newline and take the first complete message
-                    parts = buffer.split(b'\n', 1)
-                    response_data = parts[0]
-                    buffer = parts[1] if len(parts) > 1 else b""
-                    break
-                
-                # If buffer gets too large, something's wrong
-                if len(buffer) > 100000:  # 100KB limit
-                    break
-                    
+                response_data = f.readline(100000).rstrip(b'\n')  # 100KB limit
             except socket.timeout:
-                # If we have some data, try to use it
-                if buffer:
-                    response_data = buffer
-                    buffer = b""
-                    break
-                # Continue waiting if no data yet
-                continue
+                response_data = b""
         
         # Properly close the connection
         try:
@@ -102,10 +166,10 @@ def test_electrumx_connection(host, port, use_ssl=False, timeout=5):
         
         if response_data:
             try:
-                response_json = json.loads(response_data.decode().strip())
+                response_json = json_loads(response_data)
                 return True, response_json
-            except json.JSONDecodeError:
-                return True, {"raw": response_data.decode()[:200]}
+            except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+                return True, {"raw": response_data[:200].decode(errors='replace')}
         else:
             return False, "No response received (server may be slow or not responding)"
             
@@ -128,28 +192,21 @@ def validate_jsonrpc_response(response: dict, expected_id: int = None) -> tuple:
     if not isinstance(response, dict):
         return False, "Response is not a dictionary"
     
-    # Check for JSON-RPC version
-    if "jsonrpc" not in response:
-        return False, "Missing 'jsonrpc' field"
+    # Check for JSON-RPC version, then ID (the version is validated before 'id' is looked at)
+    for field in JSONRPC_REQUIRED_FIELDS:
+        if field not in response:
+            return False, f"Missing '{field}' field"
+        if field == "jsonrpc" and response["jsonrpc"] != "2.0":
+            return False, f"Invalid JSON-RPC version: {response['jsonrpc']}"
     
-    if response.get("jsonrpc") != "2.0":
-        return False, f"Invalid JSON-RPC version: {response.get('jsonrpc')}"
-    
-    # Check for ID
-    if "id" not in response:
-        return False, "Missing 'id' field"
-    
-    if expected_id is not None and response.get("id") != expected_id:
-        return False, f"ID mismatch: expected {expected_id}, got {response.get('id')}"
+    if expected_id is not None and response["id"] != expected_id:
+        return False, f"ID mismatch: expected {expected_id}, got {response['id']}"
     
     # Check for result or error
-    has_result = "result" in response
-    has_error = "error" in response
-    
-    if not has_result and not has_error:
+    if response.keys().isdisjoint(JSONRPC_PAYLOAD_KEYS):
         return False, "Response must contain 'result' or 'error'"
     
-    if has_error:
+    if "error" in response:
         error = response["error"]
         if not isinstance(error, dict):
             return False, "Error field must be a dictionary"
@@ -168,10 +225,10 @@ def validate_transaction_response(tx: dict) -> tuple:
     if not isinstance(tx, dict):
         return False, "Transaction is not a dictionary"
     
-    required_fields = ["txid", "hash", "status", "vin", "vout"]
-    for field in required_fields:
-        if field not in tx:
-            return False, f"Missing required field: {field}"
+    # One subset test covers the common (valid) case; only name the missing field on failure
+    if not TX_REQUIRED_KEYS <= tx.keys():
+        missing = next(field for field in TX_REQUIRED_FIELDS if field not in tx)
+        return False, f"Missing required field: {missing}"
     
     if not isinstance(tx["vin"], list):
         return False, "vin must be a list"
@@ -188,19 +245,20 @@ def test_ssh_log_access():
     try:
         from electrumx_logs import fetch_electrumx_logs, check_electrumx_status
         
-        # First check container status
-        status_success, status = check_electrumx_status(
-            SSH_HOST, SSH_USER, ELECTRUMX_DOCKER_CONTAINER, SSH_KEY_PATH, SSH_PORT
-        )
+        # Container status and recent logs are independent SSH round-trips, so run them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_future = executor.submit(
+                check_electrumx_status, SSH_HOST, SSH_USER, ELECTRUMX_DOCKER_CONTAINER, SSH_KEY_PATH, SSH_PORT
+            )
+            logs_future = executor.submit(
+                fetch_electrumx_logs, SSH_HOST, SSH_USER, ELECTRUMX_DOCKER_CONTAINER, SSH_KEY_PATH, SSH_PORT, lines=20
+            )
+            status_success, status = status_future.result()
+            log_success, logs = logs_future.result()
         
         if not status_success:
             return False, f"Failed to check container status: {status.get('error', 'Unknown error') if status else 'No status returned'}"
         
-        # Fetch recent logs
-        log_success, logs = fetch_electrumx_logs(
-            SSH_HOST, SSH_USER, ELECTRUMX_DOCKER_CONTAINER, SSH_KEY_PATH, SSH_PORT, lines=20
-        )
-        
         if not log_success:
             return False, f"Failed to fetch logs: {logs}"
         
@@ -217,20 +275,141 @@ def test_ssh_log_access():
     except Exception as e:
         return False, f"SSH log access error: {e}"
 
+async def run_provider_tests():
+    """
+    Run the provider-based checks (Tests 3, 3b and 3c) over a single ElectrumX provider
+    
+    The provider is opened and closed once and its requests share one session
+    connection. The address history fetched for Test 3 is reused by the parsing
+    check instead of being queried again.
+    
+    Returns:
+        Dict with 'server_version' from the server.version request, 'txs' and 'error'
+        from the address query and 'tx_result' from the direct
+        blockchain.transaction.get fetch (None if not attempted)
+    """
+    from api_provider import get_provider
+    
+    results = {'server_version': None, 'txs': None, 'error': None, 'tx_result': None}
+    provider = get_provider("electrumx")
+    try:
+        if hasattr(provider, 'open'):
+            await provider.open()
+        
+        # All three tests share one connection instead of a handshake per request
+        async with provider.session():
+            # Same request as the raw socket fallback, sent through the provider's transport
+            results['server_version'] = await provider._send_request("server.version", ["LinkFinder-Test", "1.4"])
+            
+            try:
+                results['txs'] = await provider.get_address_transactions(TEST_ADDRESS)
+            except Exception as e:
+                results['error'] = e
+                return results
+            
+            # Test the blockchain.transaction.get method directly
+            results['tx_result'] = await provider._send_request("blockchain.transaction.get", [KNOWN_TX, True])
+    finally:
+        try:
+            await provider.close()
+        except Exception as close_err:
+            print(f"    Warning: Error closing connection: {close_err}")
+    
+    return results
+
+@dataclass
+class ProbeResult:
+    """Raw return value of one connectivity check and how long it took"""
+    value: Any
+    ms: float
+
+async def timed_probe(func, *args):
+    """Run a blocking check in a worker thread and time it"""
+    start = time.perf_counter()
+    value = await asyncio.to_thread(func, *args)
+    return ProbeResult(value, (time.perf_counter() - start) * 1000)
+
+async def run_network_probes():
+    """
+    Run the independent network probes concurrently
+    
+    Reachability and SSH checks don't depend on each other, so total
+    wall time is the slowest probe instead of the sum of their timeouts.
+    
+    Returns:
+        Dict of probe name -> ProbeResult
+    """
+    # SSH, ElectrumX and (when not using SSL) the optional SSL port share one selector
+    ports = [22, ELECTRUMX_PORT] if ELECTRUMX_USE_SSL else [22, ELECTRUMX_PORT, 50002]
+    probes = {
+        'ports': (probe_ports, ELECTRUMX_HOST, ports, 5),
+        'ssh_logs': (test_ssh_log_access,)
+    }
+    
+    # Use a TaskGroup where available (Python 3.11+), otherwise gather
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            tasks = {name: tg.create_task(timed_probe(*probe)) for name, probe in probes.items()}
+        return {name: task.result() for name, task in tasks.items()}
+    
+    results = await asyncio.gather(*(timed_probe(*probe) for probe in probes.values()))
+    return dict(zip(probes, results))
+
+async def run_provider_checks():
+    """Run and time the provider checks, falling back to the raw socket test without a provider"""
+    start = time.perf_counter()
+    try:
+        provider_results = await run_provider_tests()
+    except ImportError as e:
+        # Provider unavailable: fall back to the raw socket server.version check for Test 3b
+        raw_socket = await asyncio.to_thread(test_electrumx_connection, ELECTRUMX_HOST, ELECTRUMX_PORT, ELECTRUMX_USE_SSL, 5)
+        provider_results = {'server_version': None, 'txs': None, 'error': e, 'tx_result': None, 'raw_socket': raw_socket}
+    except Exception as e:
+        provider_results = {'server_version': None, 'txs': None, 'error': e, 'tx_result': None}
+    return ProbeResult(provider_results, (time.perf_counter() - start) * 1000)
+
+async def run_all():
+    """
+    Run the network probes and the provider checks concurrently
+    
+    The provider's socket I/O blocks the event loop it runs on, so the probe set gets
+    its own loop in a worker thread. gather starts that thread before the provider
+    checks begin, and total time is the slower of the two instead of their sum.
+    
+    Returns:
+        Tuple of (probe name -> ProbeResult, ProbeResult of the provider checks)
+    """
+    return tuple(await asyncio.gather(
+        asyncio.to_thread(asyncio.run, run_network_probes()),
+        run_provider_checks(),
+    ))
+
 def main():
     print("\n" + "="*70)
     print("CONNECTIVITY TEST - Host PC and ElectrumX Server")
     print("="*70)
-    print(f"\nTarget Host: {ELECTRUMX_HOST}")
+    try:
+        target_ips = ", ".join(dict.fromkeys(sockaddr[0] for _, sockaddr in resolve_host(ELECTRUMX_HOST)))
+    except OSError:
+        target_ips = "unresolved"
+    print(f"\nTarget Host: {ELECTRUMX_HOST} ({target_ips})")
     print(f"ElectrumX Port: {ELECTRUMX_PORT}")
     print(f"Use SSL: {ELECTRUMX_USE_SSL}")
     print("\n" + "-"*70)
     
+    # Tests 1, 2, 5 and 6 are independent, so probe them all at once while the provider
+    # checks run over one connection. Results are reported in order below.
+    print("\nRunning connectivity checks...")
+    run_start = time.perf_counter()
+    probes, provider_run = asyncio.run(run_all())
+    run_ms = (time.perf_counter() - run_start) * 1000
+    provider_results = provider_run.value
+    
     # Test 1: Basic host reachability (test on a common port or SSH port)
     print("\n[TEST 1] Testing basic host reachability...")
     print(f"  Attempting to connect to {ELECTRUMX_HOST}:22 (SSH port)...")
     
-    ssh_reachable = test_host_reachability(ELECTRUMX_HOST, 22, timeout=5)
+    ssh_reachable = probes['ports'].value[22]
     if ssh_reachable:
         print(f"  ✓ Host {ELECTRUMX_HOST} is reachable (SSH port 22)")
     else:
@@ -241,7 +420,7 @@ def main():
     print(f"\n[TEST 2] Testing ElectrumX port reachability...")
     print(f"  Attempting to connect to {ELECTRUMX_HOST}:{ELECTRUMX_PORT}...")
     
-    port_reachable = test_host_reachability(ELECTRUMX_HOST, ELECTRUMX_PORT, timeout=5)
+    port_reachable = probes['ports'].value[ELECTRUMX_PORT]
     if port_reachable:
         print(f"  ✓ Port {ELECTRUMX_PORT} is open and reachable")
     else:
@@ -254,67 +433,38 @@ def main():
     # Test 3: ElectrumX protocol communication (using actual provider)
     print(f"\n[TEST 3] Testing ElectrumX protocol communication...")
     print(f"  Using actual provider to test connection...")
+    print(f"    Testing connection to {ELECTRUMX_HOST}:{ELECTRUMX_PORT}...")
+    print(f"    Testing with address: {TEST_ADDRESS}")
     
-    protocol_success = False
-    provider = None
-    try:
-        from api_provider import get_provider
-        provider = get_provider("electrumx")
-        
-        # Open connection explicitly at the start
-        if hasattr(provider, 'open'):
-            async def test_connection():
-                await provider.open()
-                return await provider.get_address_transactions(test_address)
-            
-            # Use a simple address with few transactions for testing
-            # (Genesis address has 54k+ transactions which takes too long)
-            test_address = "38YEkk8pKA1DXWhQTdW53ibXUaFDYqk269" #"1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2"  # Small address for testing
-            print(f"    Testing connection to {ELECTRUMX_HOST}:{ELECTRUMX_PORT}...")
-            print(f"    Testing with address: {test_address}")
-            txs = asyncio.run(test_connection())
-        else:
-            # Fallback for providers without open() method
-            test_address = "38YEkk8pKA1DXWhQTdW53ibXUaFDYqk269"
-            print(f"    Testing connection to {ELECTRUMX_HOST}:{ELECTRUMX_PORT}...")
-            print(f"    Testing with address: {test_address}")
-            txs = asyncio.run(provider.get_address_transactions(test_address))
-        
-        # If we get here without exception, connection works
-        protocol_success = True
+    txs = provider_results['txs']
+    protocol_success = provider_results['error'] is None
+    if protocol_success:
         if txs is not None:
             print(f"  ✓ SUCCESS - Connection established, received response")
             print(f"    (Server returned {len(txs)} transactions - may be syncing)")
         else:
             print(f"  ✓ SUCCESS - Connection established")
             print(f"    (Server responded but returned None - may still be syncing)")
-        
-    except Exception as e:
+    else:
         print(f"  ✗ FAILED - Could not establish connection")
-        print(f"    Error: {e}")
-        protocol_success = False
-    finally:
-        # Ensure connection is closed
-        if provider is not None:
-            try:
-                asyncio.run(provider.close())
-            except Exception as close_err:
-                print(f"    Warning: Error closing connection: {close_err}")
+        print(f"    Error: {provider_results['error']}")
     
     # Also try the simple socket test for comparison
-    print(f"\n[TEST 3b] Testing raw socket protocol...")
-    socket_success, result = test_electrumx_connection(
-        ELECTRUMX_HOST, 
-        ELECTRUMX_PORT, 
-        use_ssl=ELECTRUMX_USE_SSL,
-        timeout=5
-    )
-    
-    if socket_success:
-        print(f"  ✓ Raw socket test also succeeded")
+    print(f"\n[TEST 3b] Testing server.version request...")
+    if 'raw_socket' not in provider_results:
+        server_version = provider_results['server_version']
+        if server_version:
+            print(f"  ✓ server.version request succeeded")
+            print(f"    Server version: {server_version}")
+        else:
+            print(f"  ⚠️  server.version request failed or returned an error")
+    elif provider_results['raw_socket'][0]:
+        # Provider could not be imported; the raw socket fallback answered instead
+        result = provider_results['raw_socket'][1]
+        print(f"  ✓ Raw socket test succeeded (provider unavailable)")
         if isinstance(result, dict):
             # Validate JSON-RPC response
-            is_valid, validation_error = validate_jsonrpc_response(result, expected_id=1)
+            is_valid, validation_error = validate_jsonrpc_response(result, expected_id=SERVER_VERSION_REQUEST_ID)
             if is_valid:
                 if "result" in result:
                     print(f"    Server version: {result.get('result', 'Unknown')}")
@@ -324,8 +474,7 @@ def main():
             else:
                 print(f"    ⚠️  Response validation failed: {validation_error}")
     else:
-        print(f"  ⚠️  Raw socket test failed (but provider test passed)")
-        print(f"    This is OK - provider handles protocol better")
+        print(f"  ✗ Raw socket test failed: {provider_results['raw_socket'][1]}")
     
     # Test 3c: Validate transaction response parsing
     print(f"\n[TEST 3c] Testing transaction response parsing...")
@@ -334,87 +483,51 @@ def main():
     parsing_details = None
     
     if protocol_success:
-        provider = None
-        try:
-            from api_provider import get_provider, ElectrumXProvider
-            provider = get_provider("electrumx")
-            
-            async def test_parsing():
-                # Open connection explicitly
-                if hasattr(provider, 'open'):
-                    await provider.open()
-                
-                # Test direct transaction fetch with a known tx hash
-                # This tests the blockchain.transaction.get method directly
-                print(f"    Testing direct transaction fetch...")
-                known_tx = "065f3cf51e45fff9063ebc50deb2af5e24b1817020e4de19a782eafee90f5b4e" #"4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b"  # Genesis coinbase tx
-                
-                tx_fetch_success = False
-                # Use internal method to test transaction fetch directly
-                if isinstance(provider, ElectrumXProvider):
-                    tx_result = await provider._send_request("blockchain.transaction.get", [known_tx, True])
-                    if tx_result:
-                        print(f"    ✓ Direct transaction fetch succeeded")
-                        print(f"      Response type: {type(tx_result).__name__}")
-                        if isinstance(tx_result, dict):
-                            print(f"      Keys: {list(tx_result.keys())[:8]}")
-                            if "vin" in tx_result and "vout" in tx_result:
-                                print(f"      Has vin: {len(tx_result.get('vin', []))} inputs")
-                                print(f"      Has vout: {len(tx_result.get('vout', []))} outputs")
-                                tx_fetch_success = True
-                            else:
-                                print(f"      ⚠️ Response missing vin/vout - may be hex format")
-                        elif isinstance(tx_result, str):
-                            print(f"      Response is hex string ({len(tx_result)} chars)")
-                            print(f"      ⚠️ verbose=True returned hex instead of dict")
-                    else:
-                        print(f"    ✗ Direct transaction fetch returned empty")
-                
-                # Also test full address query with small address
-                print(f"    Testing address transaction history...")
-                test_address = "38YEkk8pKA1DXWhQTdW53ibXUaFDYqk269" #"1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2"  # Small address
-                txs = await provider.get_address_transactions(test_address)
-                return txs, tx_fetch_success
-            
-            txs, tx_fetch_success = asyncio.run(test_parsing())
-            
-            if txs is not None:
-                if len(txs) > 0:
-                    # Validate first transaction structure
-                    first_tx = txs[0]
-                    is_valid, validation_error = validate_transaction_response(first_tx)
-                    if is_valid:
-                        parsing_success = True
-                        parsing_details = {
-                            "tx_count": len(txs),
-                            "sample_txid": first_tx.get("txid", "unknown")[:16] + "...",
-                            "has_vin": len(first_tx.get("vin", [])) > 0,
-                            "has_vout": len(first_tx.get("vout", [])) > 0
-                        }
-                        print(f"  ✓ Transaction parsing validated")
-                        print(f"    Found {len(txs)} transactions")
-                        print(f"    Sample TX: {parsing_details['sample_txid']}")
-                        print(f"    Has vin: {parsing_details['has_vin']}, Has vout: {parsing_details['has_vout']}")
-                    else:
-                        print(f"  ✗ Transaction validation failed: {validation_error}")
-                        print(f"    First tx: {first_tx}")
+        print(f"    Testing direct transaction fetch...")
+        tx_result = provider_results['tx_result']
+        if tx_result:
+            print(f"    ✓ Direct transaction fetch succeeded")
+            print(f"      Response type: {type(tx_result).__name__}")
+            if isinstance(tx_result, dict):
+                print(f"      Keys: {list(tx_result.keys())[:8]}")
+                if "vin" in tx_result and "vout" in tx_result:
+                    print(f"      Has vin: {len(tx_result.get('vin', []))} inputs")
+                    print(f"      Has vout: {len(tx_result.get('vout', []))} outputs")
                 else:
-                    print(f"  ⚠️  No transactions found (server may still be syncing)")
-                    parsing_success = True  # Still consider it a success if we got an empty list
+                    print(f"      ⚠️ Response missing vin/vout - may be hex format")
+            elif isinstance(tx_result, str):
+                print(f"      Response is hex string ({len(tx_result)} chars)")
+                print(f"      ⚠️ verbose=True returned hex instead of dict")
+        else:
+            print(f"    ✗ Direct transaction fetch returned empty")
+        
+        # The address history was already fetched in Test 3, so validate that
+        print(f"    Testing address transaction history...")
+        if txs is not None:
+            if len(txs) > 0:
+                # Validate first transaction structure
+                first_tx = txs[0]
+                is_valid, validation_error = validate_transaction_response(first_tx)
+                if is_valid:
+                    parsing_success = True
+                    parsing_details = {
+                        "tx_count": len(txs),
+                        "sample_txid": first_tx.get("txid", "unknown")[:16] + "...",
+                        "has_vin": len(first_tx.get("vin", [])) > 0,
+                        "has_vout": len(first_tx.get("vout", [])) > 0
+                    }
+                    print(f"  ✓ Transaction parsing validated")
+                    print(f"    Found {len(txs)} transactions")
+                    print(f"    Sample TX: {parsing_details['sample_txid']}")
+                    print(f"    Has vin: {parsing_details['has_vin']}, Has vout: {parsing_details['has_vout']}")
+                else:
+                    print(f"  ✗ Transaction validation failed: {validation_error}")
+                    print(f"    First tx: {first_tx}")
             else:
-                print(f"  ⚠️  Provider returned None (may indicate connection issue)")
-            
-        except Exception as e:
-            import traceback
-            print(f"  ✗ Transaction parsing test failed: {e}")
-            traceback.print_exc()
-        finally:
-            # Ensure connection is closed
-            if provider is not None:
-                try:
-                    asyncio.run(provider.close())
-                except Exception as close_err:
-                    print(f"    Warning: Error closing connection: {close_err}")
+                print(f"  ⚠️  No transactions found (server may still be syncing)")
+                parsing_success = True  # Still consider it a success if we got an empty list
+        else:
+            print(f"  ⚠️  Provider returned None (may indicate connection issue)")
     else:
         print(f"  - Skipped (protocol test failed)")
     
@@ -436,7 +549,7 @@ def main():
         print(f"\n[TEST 5] Testing SSL port (optional)...")
         print(f"  Attempting to connect to {ELECTRUMX_HOST}:{ssl_port}...")
         
-        ssl_port_reachable = test_host_reachability(ELECTRUMX_HOST, ssl_port, timeout=5)
+        ssl_port_reachable = probes['ports'].value[ssl_port]
         if ssl_port_reachable:
             print(f"  ✓ SSL port {ssl_port} is also available")
             print(f"    (You could use SSL by setting ELECTRUMX_USE_SSL=true)")
@@ -445,7 +558,7 @@ def main():
     
     # Test 6: SSH log access
     print(f"\n[TEST 6] Testing SSH log access...")
-    ssh_log_result, ssh_log_data = test_ssh_log_access()
+    ssh_log_result, ssh_log_data = probes['ssh_logs'].value
     
     ssh_log_success = False
     if ssh_log_result is None:
@@ -472,23 +585,26 @@ def main():
     print("SUMMARY")
     print("="*70)
     
+    # (test name, passed, duration in ms or None)
     all_tests = [
-        ("Host Reachability", ssh_reachable or port_reachable),
-        ("ElectrumX Port Open", port_reachable),
-        ("ElectrumX Protocol", success),
-        ("Response Parsing", parsing_success if 'parsing_success' in locals() else None),
-        ("Blockchain Query", blockchain_test_success if blockchain_test_attempted else None),
-        ("SSH Log Access", ssh_log_success if 'ssh_log_success' in locals() else None)
+        ("Host Reachability", ssh_reachable or port_reachable, probes['ports'].ms),
+        ("ElectrumX Port Open", port_reachable, probes['ports'].ms),
+        ("ElectrumX Protocol", success, provider_run.ms),
+        ("Response Parsing", parsing_success if 'parsing_success' in locals() else None, None),
+        ("Blockchain Query", blockchain_test_success if blockchain_test_attempted else None, None),
+        ("SSH Log Access", ssh_log_success if 'ssh_log_success' in locals() else None, probes['ssh_logs'].ms)
     ]
     
-    for test_name, passed in all_tests:
+    for test_name, passed, ms in all_tests:
         if passed is None:
             status = "- SKIP"
         elif passed:
             status = "✓ PASS"
         else:
             status = "✗ FAIL"
-        print(f"  {status} - {test_name}")
+        timing = f"  ({ms:.0f} ms)" if ms is not None and passed is not None else ""
+        print(f"  {status} - {test_name}{timing}")
+    print(f"\n  Total check time: {run_ms:.0f} ms")
     
     if port_reachable and success:
         if blockchain_test_success:
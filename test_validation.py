@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Offline checks for the response validators in test_connectivity.py
+The first problem found is the one reported, so responses with several problems pin the check order
+"""
+from test_connectivity import validate_jsonrpc_response, SERVER_VERSION_REQUEST_ID
+
+def test_version_reported_before_missing_id():
+    """A wrong version and a missing id report the version (baseline order)"""
+    response = {"jsonrpc": "1.0", "result": "ok"}
+    assert validate_jsonrpc_response(response) == (False, "Invalid JSON-RPC version: 1.0")
+
+def test_missing_jsonrpc_reported_first():
+    """No jsonrpc, no id and no payload reports the missing jsonrpc field"""
+    assert validate_jsonrpc_response({}) == (False, "Missing 'jsonrpc' field")
+
+def test_missing_id_reported_before_payload():
+    """A missing id and a missing result/error report the missing id"""
+    assert validate_jsonrpc_response({"jsonrpc": "2.0"}) == (False, "Missing 'id' field")
+
+def test_id_mismatch_reported_before_payload():
+    """A wrong id and a missing result/error report the id mismatch"""
+    response = {"jsonrpc": "2.0", "id": 7}
+    assert validate_jsonrpc_response(response, expected_id=SERVER_VERSION_REQUEST_ID) == (
+        False, f"ID mismatch: expected {SERVER_VERSION_REQUEST_ID}, got 7")
+
+def test_valid_response():
+    """A well-formed server.version reply passes"""
+    response = {"jsonrpc": "2.0", "id": SERVER_VERSION_REQUEST_ID, "result": ["ElectrumX 1.16", "1.4"]}
+    assert validate_jsonrpc_response(response, expected_id=SERVER_VERSION_REQUEST_ID) == (True, None)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -7,9 +7,48 @@ Verifies that visited and queued addresses are actually saved in checkpoints
 Now includes comprehensive queue analysis and capacity monitoring
 """
 
+import json
 import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+def load_counts(cp_file):
+    """Return (timestamp, visited_count, queued_count) for a checkpoint file
+    
+    Reads the small .meta.json sidecar written by CheckpointManager when present,
+    falling back to unpickling the whole checkpoint for older files.
+    """
+    meta_file = cp_file.with_suffix('.meta.json')
+    if meta_file.exists():
+        meta = json_loads(meta_file.read_bytes())
+        timestamp = meta.get('timestamp')
+        visited_count = meta.get('visited', 0)
+        queued_count = meta.get('queued_forward', 0) + meta.get('queued_backward', 0)
+    else:
+        with open(cp_file, 'rb') as f:
+            data = pickle.load(f)
+        
+        # Only the counts are needed; empty-tuple defaults avoid allocating lists
+        ts = (data.get('state') or {}).get('trace_state') or {}
+        visited_count = len(ts.get('visited', ()))
+        queued_count = len(ts.get('queued_forward', ())) + len(ts.get('queued_backward', ()))
+        timestamp = data.get('timestamp', 'N/A')
+        del data, ts  # Drop the unpickled checkpoint before formatting the result
+    
+    if isinstance(timestamp, str):
+        timestamp = timestamp[:19]
+    else:
+        timestamp = 'N/A'
+    return timestamp, visited_count, queued_count
+
 def verify_checkpoint_addresses():
     """Verify that addresses are saved in checkpoints"""
     
@@ -40,33 +79,17 @@ def verify_checkpoint_addresses():
     with open(latest, 'rb') as f:
         cp_data = pickle.load(f)
     
-    state = cp_data.get('state', {})
-    trace_state = state.get('trace_state', {})
+    state = cp_data.get('state') or {}
+    trace_state = state.get('trace_state') or {}
     
     # Extract addresses
-    visited = trace_state.get('visited', [])
-    visited_forward = trace_state.get('visited_forward', [])
-    visited_backward = trace_state.get('visited_backward', [])
-    queued_forward = trace_state.get('queued_forward', [])
-    queued_backward = trace_state.get('queued_backward', [])
-    
-    # Convert to list if it's a set
-    if isinstance(visited, set):
-        visited = list(visited)
-    if isinstance(visited_forward, set):
-        visited_forward = list(visited_forward)
-    if isinstance(visited_backward, set):
-        visited_backward = list(visited_backward)
-    if isinstance(queued_forward, set):
-        queued_forward = list(queued_forward)
-    if isinstance(queued_backward, set):
-        queued_backward = list(queued_backward)
-    
-    # Handle dict format (for visited_forward/backward)
-    if isinstance(visited_forward, dict):
-        visited_forward = list(visited_forward.keys())
-    if isinstance(visited_backward, dict):
-        visited_backward = list(visited_backward.keys())
+    visited, visited_forward, visited_backward, queued_forward, queued_backward = (
+        trace_state.get(key, ())
+        for key in ('visited', 'visited_forward', 'visited_backward', 'queued_forward', 'queued_backward')
+    )
+    
+    # Sets and dicts (visited_forward/backward) are used as-is: len(), set() and
+    # islice() below all work on them without copying into a list first
     
     print("\n" + "=" * 80)
     print("CHECKPOINT DATA SUMMARY")
@@ -81,9 +104,12 @@ def verify_checkpoint_addresses():
     print("\n" + "=" * 80)
     print("VISITED BREAKDOWN")
     print("=" * 80)
-    forward_only = len(set(visited_forward) - set(visited_backward))
-    backward_only = len(set(visited_backward) - set(visited_forward))
-    overlap = len(set(visited_forward) & set(visited_backward))
+    # Build each set once and reuse it for all three comparisons
+    forward_set = set(visited_forward)
+    backward_set = set(visited_backward)
+    forward_only = len(forward_set - backward_set)
+    backward_only = len(backward_set - forward_set)
+    overlap = len(forward_set & backward_set)
     
     print(f"  Forward-only:         {forward_only:>8,}")
     print(f"  Backward-only:        {backward_only:>8,}")
@@ -110,19 +136,19 @@ def verify_checkpoint_addresses():
     
     if visited:
         print(f"\n  Visited addresses ({len(visited)} total):")
-        for i, addr in enumerate(visited[:5], 1):
+        for i, addr in enumerate(islice(visited, 5), 1):
             print(f"    {i}. {addr}")
     else:
         print(f"\n  [ERROR] NO visited addresses found!")
     
     if queued_forward:
         print(f"\n  Forward queued addresses ({len(queued_forward)} total):")
-        for i, addr in enumerate(queued_forward[:5], 1):
+        for i, addr in enumerate(islice(queued_forward, 5), 1):
             print(f"    {i}. {addr}")
     
     if queued_backward:
         print(f"\n  Backward queued addresses ({len(queued_backward)} total):")
-        for i, addr in enumerate(queued_backward[:5], 1):
+        for i, addr in enumerate(islice(queued_backward, 5), 1):
             print(f"    {i}. {addr}")
     
     # Verify address format
@@ -130,7 +156,7 @@ def verify_checkpoint_addresses():
     print("ADDRESS FORMAT VERIFICATION")
     print("=" * 80)
     if visited:
-        sample_addr = visited[0]
+        sample_addr = next(iter(visited))
         print(f"  Sample address: {sample_addr}")
         print(f"  Length:         {len(sample_addr)}")
         print(f"  Prefix:         {sample_addr[:3]}")
@@ -159,21 +185,14 @@ def verify_checkpoint_addresses():
     print(f"  {'Timestamp':<22} {'Visited':>12} {'Queued':>12}")
     print("  " + "-" * 50)
     
-    for cp_file in checkpoint_files[:10]:
+    # Load the files concurrently (reads release the GIL), print in original order
+    history_files = checkpoint_files[:10]
+    with ThreadPoolExecutor(max_workers=min(4, len(history_files))) as executor:
+        futures = [executor.submit(load_counts, cp_file) for cp_file in history_files]
+    
+    for future in futures:
         try:
-            with open(cp_file, 'rb') as f:
-                data = pickle.load(f)
-            
-            ts = data.get('state', {}).get('trace_state', {})
-            visited_count = len(ts.get('visited', []))
-            queued_count = len(ts.get('queued_forward', [])) + len(ts.get('queued_backward', []))
-            timestamp = data.get('timestamp', 'N/A')
-            
-            if isinstance(timestamp, str):
-                timestamp = timestamp[:19]
-            else:
-                timestamp = 'N/A'
-            
+            timestamp, visited_count, queued_count = future.result()
             print(f"  {timestamp:<22} {visited_count:>12,} {queued_count:>12,}")
         except Exception as e:
             print(f"  Error reading checkpoint: {e}")
@@ -201,4 +220,7 @@ def verify_checkpoint_addresses():
     print("\n" + "=" * 80 + "\n")
 
 if __name__ == "__main__":
+    # The report is many short lines; block-buffer them instead of flushing each line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
     verify_checkpoint_addresses()
\ No newline at end of file